@@ -2,25 +2,93 @@
 Main accounting application with tkinter GUI.
 """
 
+import re
+import time
 import tkinter as tk
+from operator import itemgetter
+from typing import Tuple, Union
 from tkinter import ttk, messagebox, scrolledtext
 from datetime import datetime
 from database import AccountingDB
-from reports import ReportGenerator
+
+
+_row_getter = itemgetter('id', 'date', 'type', 'category', 'amount', 'description')
+
+# Display names for transaction types, avoiding a capitalize() per row
+_TYPE_CAP = {'income': 'Income', 'expense': 'Expense'}
+
+# (column, heading, width) for each column of the transactions treeview
+_TRANSACTION_COLUMNS = (
+    ('ID', 'ID', 50),
+    ('Date', 'Date', 100),
+    ('Type', 'Type', 80),
+    ('Category', 'Category', 120),
+    ('Amount', 'Amount', 100),
+    ('Description', 'Description', 300),
+)
+
+# Match exactly the strings strptime("%Y-%m-%d") and float() accept, so
+# malformed input is rejected without raising
+_DATE_RE = re.compile(r"(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])")
+_DIGITS = r"\d(?:_?\d)*"
+_AMOUNT_RE = re.compile(
+    rf"[+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:e[+-]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)",
+    re.IGNORECASE
+)
+
+
+def _configure_tree(tree, specs):
+    """Set a treeview's headings and widths from (column, heading, width) specs."""
+    for column, heading, width in specs:
+        tree.heading(column, text=heading)
+        tree.column(column, width=width)
+
+
+# Today's date string and the time.time() at which it was computed
+_today_cache = {'t': 0.0, 'v': ''}
+
+
+def _today() -> str:
+    """Return today's date as YYYY-MM-DD, recomputed at most every 30 seconds."""
+    now = time.time()
+    if now - _today_cache['t'] > 30:
+        _today_cache.update(t=now, v=datetime.now().strftime("%Y-%m-%d"))
+    return _today_cache['v']
+
+
+def _valid_date(date_str: str) -> bool:
+    """Check that a string is a real calendar date in YYYY-MM-DD format."""
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return False
+
+    year, month, day = map(int, match.groups())
+    try:
+        datetime(year, month, day)
+    except ValueError:
+        return False
+    return True
 
 
 class AccountingApp:
     """Main application class for the accounting GUI."""
 
+    # Number of changed rows above which the treeview is unmapped while updating
+    TREE_REDRAW_THRESHOLD = 500
+
+    # Number of transactions fetched per treeview page
+    TRANSACTION_PAGE_SIZE = 200
+
     def __init__(self, root):
         """Initialize the application."""
         self.root = root
         self.root.title("Personal Accounting App")
         self.root.geometry("1000x700")
 
-        # Initialize database and reports
+        # Initialize database; the report generator is created on first use
         self.db = AccountingDB()
-        self.report_gen = ReportGenerator(self.db)
+        self._report_gen = None
 
         # Common categories
         self.income_categories = [
@@ -31,11 +99,25 @@ class AccountingApp:
             "Healthcare", "Education", "Dining", "Shopping", "Other"
         ]
 
+        # Transaction type whose categories the combobox currently lists
+        self._last_category_type = None
+
+        # Whether the balance label is currently colored as non-negative
+        self._last_balance_positive = None
+
         # Create GUI
         self.create_widgets()
         self.refresh_transaction_list()
         self.update_summary()
 
+    @property
+    def report_gen(self):
+        """Report generator, imported and created on first access."""
+        if self._report_gen is None:
+            from reports import ReportGenerator
+            self._report_gen = ReportGenerator(self.db)
+        return self._report_gen
+
     def create_widgets(self):
         """Create and layout all GUI widgets."""
         # Create notebook for tabs
@@ -161,7 +243,7 @@ class AccountingApp:
 
         # Date
         ttk.Label(form_frame, text="Date:").grid(row=1, column=0, sticky='w', pady=5)
-        self.date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
+        self.date_var = tk.StringVar(value=_today())
         ttk.Entry(form_frame, textvariable=self.date_var, width=30).grid(
             row=1, column=1, sticky='w', pady=5
         )
@@ -192,6 +274,17 @@ class AccountingApp:
             row=4, column=1, sticky='w', pady=5
         )
 
+        # Mirror form values into plain attributes as they are edited so
+        # add_transaction does not have to read them back from Tcl
+        for name, var in (
+            ('type', self.trans_type_var),
+            ('date', self.date_var),
+            ('category', self.category_var),
+            ('amount', self.amount_var),
+            ('description', self.description_var),
+        ):
+            self._mirror_form_var(name, var)
+
         # Buttons
         button_frame = ttk.Frame(add_frame)
         button_frame.pack(pady=20)
@@ -241,34 +334,28 @@ class AccountingApp:
         tree_frame = ttk.Frame(trans_frame)
         tree_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
+        # Transaction ID -> treeview item ID for rows currently displayed
+        self._tree_row_ids = {}
+        self._tree_exhausted = False
+        self._tree_load_pending = False
+
         # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame)
-        scrollbar.pack(side='right', fill='y')
+        self.trans_scrollbar = ttk.Scrollbar(tree_frame)
+        self.trans_scrollbar.pack(side='right', fill='y')
 
         # Create treeview
         self.trans_tree = ttk.Treeview(
             tree_frame,
-            columns=('ID', 'Date', 'Type', 'Category', 'Amount', 'Description'),
+            columns=tuple(spec[0] for spec in _TRANSACTION_COLUMNS),
             show='headings',
-            yscrollcommand=scrollbar.set
+            yscrollcommand=self._on_trans_tree_scroll
         )
-        scrollbar.config(command=self.trans_tree.yview)
-
-        # Define columns
-        self.trans_tree.heading('ID', text='ID')
-        self.trans_tree.heading('Date', text='Date')
-        self.trans_tree.heading('Type', text='Type')
-        self.trans_tree.heading('Category', text='Category')
-        self.trans_tree.heading('Amount', text='Amount')
-        self.trans_tree.heading('Description', text='Description')
-
-        # Set column widths
-        self.trans_tree.column('ID', width=50)
-        self.trans_tree.column('Date', width=100)
-        self.trans_tree.column('Type', width=80)
-        self.trans_tree.column('Category', width=120)
-        self.trans_tree.column('Amount', width=100)
-        self.trans_tree.column('Description', width=300)
+        self.trans_scrollbar.config(command=self.trans_tree.yview)
+        _configure_tree(self.trans_tree, _TRANSACTION_COLUMNS)
+
+        # Row colors by transaction type, applied through item tags
+        self.trans_tree.tag_configure('income', foreground='green')
+        self.trans_tree.tag_configure('expense', foreground='red')
 
         self.trans_tree.pack(fill='both', expand=True)
 
@@ -355,9 +442,20 @@ class AccountingApp:
         )
         self.report_text.pack(fill='both', expand=True)
 
+    def _mirror_form_var(self, name, var):
+        """Keep self._form_<name> equal to the value of a form variable."""
+        attr = f'_form_{name}'
+        setattr(self, attr, var.get())
+        var.trace_add('write', lambda *_: setattr(self, attr, var.get()))
+
     def update_category_list(self):
         """Update category dropdown based on transaction type."""
-        if self.trans_type_var.get() == "income":
+        trans_type = self.trans_type_var.get()
+        if trans_type == self._last_category_type:
+            return
+        self._last_category_type = trans_type
+
+        if trans_type == "income":
             self.category_combo['values'] = self.income_categories
         else:
             self.category_combo['values'] = self.expense_categories
@@ -374,7 +472,7 @@ class AccountingApp:
 
     def clear_form(self):
         """Clear the transaction form."""
-        self.date_var.set(datetime.now().strftime("%Y-%m-%d"))
+        self.date_var.set(_today())
         self.amount_var.set("")
         self.description_var.set("")
         if self.category_combo['values']:
@@ -384,31 +482,11 @@ class AccountingApp:
         """Add a new transaction to the database."""
         try:
             # Validate inputs
-            date = self.date_var.get().strip()
-            trans_type = self.trans_type_var.get()
-            category = self.category_var.get().strip()
-            amount_str = self.amount_var.get().strip()
-            description = self.description_var.get().strip()
-
-            if not date or not category or not amount_str:
-                messagebox.showerror("Error", "Please fill in all required fields.")
-                return
-
-            # Validate date format
-            try:
-                datetime.strptime(date, "%Y-%m-%d")
-            except ValueError:
-                messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD.")
-                return
-
-            # Validate amount
-            try:
-                amount = float(amount_str)
-                if amount <= 0:
-                    raise ValueError("Amount must be positive")
-            except ValueError:
-                messagebox.showerror("Error", "Invalid amount. Enter a positive number.")
+            result = self._parse_submit()
+            if isinstance(result, str):
+                messagebox.showerror("Error", result)
                 return
+            date, trans_type, category, amount, description = result
 
             # Add to database
             trans_id = self.db.add_transaction(
@@ -428,31 +506,98 @@ class AccountingApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add transaction: {str(e)}")
 
+    def _parse_submit(self) -> Union[Tuple[str, str, str, float, str], str]:
+        """
+        Validate the add-transaction form without raising.
+
+        Returns:
+            (date, trans_type, category, amount, description) on success,
+            otherwise the error message to show
+        """
+        date = self._form_date.strip()
+        category = self._form_category.strip()
+        amount_str = self._form_amount.strip()
+
+        if not date or not category or not amount_str:
+            return "Please fill in all required fields."
+
+        if not _valid_date(date):
+            return "Invalid date format. Use YYYY-MM-DD."
+
+        # Only strings float() can parse get this far, so it never raises
+        if not _AMOUNT_RE.fullmatch(amount_str):
+            return "Invalid amount. Enter a positive number."
+        amount = float(amount_str)
+        if amount <= 0:
+            return "Invalid amount. Enter a positive number."
+
+        return date, self._form_type, category, amount, self._form_description.strip()
+
     def refresh_transaction_list(self):
         """Refresh the transaction list in the treeview."""
-        # Clear existing items
-        for item in self.trans_tree.get_children():
-            self.trans_tree.delete(item)
+        # Get the first page, or as many transactions as are already loaded
+        limit = max(self.TRANSACTION_PAGE_SIZE, len(self._tree_row_ids))
+        transactions = self.db.get_transactions_page(0, limit)
+        self._tree_exhausted = len(transactions) < limit
+        new_ids = {trans['id'] for trans in transactions}
+
+        # Only rows that were added or removed since the last refresh
+        # need to cross into Tk; existing rows are left untouched
+        stale_ids = self._tree_row_ids.keys() - new_ids
+        num_added = len(new_ids) - (len(self._tree_row_ids) - len(stale_ids))
+
+        # Unmap the tree during large updates to skip intermediate redraws
+        large_update = len(stale_ids) + num_added > self.TREE_REDRAW_THRESHOLD
+        if large_update:
+            self.trans_tree.pack_forget()
+
+        # Remove deleted transactions
+        if stale_ids:
+            self.trans_tree.delete(*[self._tree_row_ids.pop(i) for i in stale_ids])
+
+        # Add new transactions at their sorted position
+        for index, trans in enumerate(transactions):
+            if trans['id'] not in self._tree_row_ids:
+                self._tree_row_ids[trans['id']] = self.trans_tree.insert(
+                    '', index, values=self._transaction_row_values(trans),
+                    tags=(trans['type'],)
+                )
 
-        # Get all transactions
-        transactions = self.db.get_all_transactions()
+        if large_update:
+            self.trans_tree.pack(fill='both', expand=True)
+
+    def load_more_transactions(self):
+        """Append the next page of transactions to the treeview."""
+        self._tree_load_pending = False
+
+        transactions = self.db.get_transactions_page(
+            len(self._tree_row_ids), self.TRANSACTION_PAGE_SIZE
+        )
+        self._tree_exhausted = len(transactions) < self.TRANSACTION_PAGE_SIZE
 
-        # Add to treeview
         for trans in transactions:
-            amount_str = f"${trans['amount']:.2f}"
-            if trans['type'] == 'expense':
-                amount_str = f"-{amount_str}"
-            else:
-                amount_str = f"+{amount_str}"
+            if trans['id'] not in self._tree_row_ids:
+                self._tree_row_ids[trans['id']] = self.trans_tree.insert(
+                    '', 'end', values=self._transaction_row_values(trans),
+                    tags=(trans['type'],)
+                )
 
-            self.trans_tree.insert('', 'end', values=(
-                trans['id'],
-                trans['date'],
-                trans['type'].capitalize(),
-                trans['category'],
-                amount_str,
-                trans['description']
-            ))
+    def _on_trans_tree_scroll(self, first, last):
+        """Update the scrollbar and load another page when the end is reached."""
+        self.trans_scrollbar.set(first, last)
+
+        if float(last) >= 1.0 and not self._tree_exhausted and not self._tree_load_pending:
+            self._tree_load_pending = True
+            self.root.after_idle(self.load_more_transactions)
+
+    @staticmethod
+    def _transaction_row_values(trans):
+        """Format a transaction as treeview column values."""
+        trans_id, date, trans_type, category, amount, description = _row_getter(trans)
+        sign = '-' if trans_type == 'expense' else '+'
+        return (
+            trans_id, date, _TYPE_CAP[trans_type], category, f"{sign}${amount:.2f}", description
+        )
 
     def delete_transaction(self):
         """Delete the selected transaction."""
@@ -483,16 +628,18 @@ class AccountingApp:
 
     def update_summary(self):
         """Update the dashboard summary statistics."""
-        total_income = self.db.get_total_income()
-        total_expenses = self.db.get_total_expenses()
-        balance = self.db.get_balance()
+        total_income, total_expenses = self.db.get_totals()
+        balance = total_income - total_expenses
 
         self.total_income_label.config(text=f"Total Income: ${total_income:,.2f}")
         self.total_expenses_label.config(text=f"Total Expenses: ${total_expenses:,.2f}")
-        self.balance_label.config(
-            text=f"Net Balance: ${balance:,.2f}",
-            fg="green" if balance >= 0 else "red"
-        )
+        self.balance_label.config(text=f"Net Balance: ${balance:,.2f}")
+
+        # Only recolor the balance when its sign changes
+        balance_positive = balance >= 0
+        if balance_positive != self._last_balance_positive:
+            self.balance_label.config(fg="green" if balance_positive else "red")
+            self._last_balance_positive = balance_positive
 
     def generate_report(self):
         """Generate and display a financial report."""
@@ -509,10 +656,7 @@ class AccountingApp:
                     return
 
                 # Validate dates
-                try:
-                    datetime.strptime(start_date, "%Y-%m-%d")
-                    datetime.strptime(end_date, "%Y-%m-%d")
-                except ValueError:
+                if not (_valid_date(start_date) and _valid_date(end_date)):
                     messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD.")
                     return
 
@@ -560,6 +704,7 @@ def main():
     root = tk.Tk()
     app = AccountingApp(root)
     root.mainloop()
+    app.db.close()
 
 
 if __name__ == "__main__":
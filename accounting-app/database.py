@@ -4,49 +4,322 @@ Handles SQLite database operations for transactions.
 """
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# SQL statements, kept as single constants so every call binds the same
+# SQL text and hits the connection's prepared-statement cache
+_SQL_ADD = '''
+    INSERT INTO transactions (date, type, category, amount, description)
+    VALUES (?, ?, ?, ?, ?)
+'''
+_SQL_DELETE = 'DELETE FROM transactions WHERE id = ?'
+
+# Rows per multi-row INSERT; 100 rows x 5 columns stays well below
+# SQLite's bound-parameter limit
+_MULTI_INSERT_ROWS = 100
+_SQL_ADD_MULTI = (
+    'INSERT INTO transactions (date, type, category, amount, description) VALUES '
+    + ', '.join(['(?, ?, ?, ?, ?)'] * _MULTI_INSERT_ROWS)
+)
+
+_SQL_ALL = '''
+    SELECT id, date, type, category, amount, description
+    FROM transactions
+    ORDER BY date DESC, id DESC
+'''
+_SQL_RANGE = '''
+    SELECT id, date, type, category, amount, description
+    FROM transactions
+    WHERE date BETWEEN ? AND ?
+    ORDER BY date DESC, id DESC
+'''
+_SQL_BY_TYPE = '''
+    SELECT id, date, type, category, amount, description
+    FROM transactions
+    WHERE type = ?
+    ORDER BY date DESC, id DESC
+'''
+_SQL_PAGE = '''
+    SELECT id, date, type, category, amount, description
+    FROM transactions
+    ORDER BY date DESC, id DESC
+    LIMIT ? OFFSET ?
+'''
+_SQL_COUNT = 'SELECT COUNT(*) FROM transactions'
+_SQL_COUNT_RANGE = '''
+    SELECT COUNT(*) FROM transactions
+    WHERE date BETWEEN ? AND ?
+'''
+_SQL_TOTAL = '''
+    SELECT SUM(amount) FROM transactions
+    WHERE type = ?
+'''
+_SQL_TOTAL_RANGE = '''
+    SELECT SUM(amount) FROM transactions
+    WHERE type = ? AND date BETWEEN ? AND ?
+'''
+_SQL_BALANCE = '''
+    SELECT SUM(CASE WHEN type = 'income' THEN amount ELSE -amount END)
+    FROM transactions
+'''
+_SQL_BALANCE_RANGE = '''
+    SELECT SUM(CASE WHEN type = 'income' THEN amount ELSE -amount END)
+    FROM transactions
+    WHERE date BETWEEN ? AND ?
+'''
+_SQL_TOTALS = '''
+    SELECT type, SUM(amount) FROM transactions
+    GROUP BY type
+'''
+_SQL_REPORT_AGG = '''
+    SELECT type, category, SUM(amount)
+    FROM transactions
+    GROUP BY type, category
+'''
+_SQL_REPORT_AGG_RANGE = '''
+    SELECT type, category, SUM(amount)
+    FROM transactions
+    WHERE date BETWEEN ? AND ?
+    GROUP BY type, category
+'''
+_SQL_BY_CAT_INCOME = '''
+    SELECT category, SUM(amount) as total
+    FROM transactions
+    WHERE type = 'income'
+    GROUP BY category
+    ORDER BY total DESC
+'''
+_SQL_BY_CAT_INCOME_RANGE = '''
+    SELECT category, SUM(amount) as total
+    FROM transactions
+    WHERE type = 'income' AND date BETWEEN ? AND ?
+    GROUP BY category
+    ORDER BY total DESC
+'''
+_SQL_BY_CAT_EXPENSE = '''
+    SELECT category, SUM(amount) as total
+    FROM transactions
+    WHERE type = 'expense'
+    GROUP BY category
+    ORDER BY total DESC
+'''
+_SQL_BY_CAT_EXPENSE_RANGE = '''
+    SELECT category, SUM(amount) as total
+    FROM transactions
+    WHERE type = 'expense' AND date BETWEEN ? AND ?
+    GROUP BY category
+    ORDER BY total DESC
+'''
+
+# Sort orders accepted by get_all_transactions, each prebuilt into a full
+# statement so no caller-supplied text ever reaches the SQL
+_ORDER_BY = {
+    'date_desc': 'date DESC, id DESC',
+    'date_asc': 'date ASC, id ASC',
+    'amount_desc': 'amount DESC',
+    'id_desc': 'id DESC',
+}
+_SQL_ALL_ORDERED = {
+    key: 'SELECT id, date, type, category, amount, description '
+         f'FROM transactions ORDER BY {clause}'
+    for key, clause in _ORDER_BY.items()
+}
+
+# Compiled statements kept per connection; comfortably above the number
+# of distinct statements above
+_STATEMENT_CACHE_SIZE = 256
 
 
 class AccountingDB:
     """Manages database operations for the accounting application."""
 
-    def __init__(self, db_name: str = "accounting.db"):
-        """Initialize database connection and create tables if needed."""
+    def __init__(self, db_name: str = "accounting.db", auto_commit: bool = True):
+        """
+        Initialize database connection and create tables if needed.
+
+        Args:
+            db_name: Path to the SQLite database file
+            auto_commit: Commit after every write. When False, writes
+                accumulate in one open transaction until task_done()
+        """
         self.db_name = db_name
+        self.auto_commit = auto_commit
         self.conn = None
+
+        # Writes are serialized on self.conn; each thread reads through a
+        # read-only connection of its own so WAL readers run concurrently
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+
+        # Bumped on every write so cached aggregates know when to recompute
+        self._db_version = 0
+        self._cached_totals_version = None
+        self._cached_totals = (0.0, 0.0)
+
+        self.connect()
         self.create_tables()
 
     def connect(self):
-        """Establish database connection."""
-        self.conn = sqlite3.connect(self.db_name)
-        self.conn.row_factory = sqlite3.Row
+        """
+        Open the writer connection shared by all write operations.
+
+        The connection stays open until close(), so SQLite's page cache
+        survives between calls. It runs in autocommit mode; multi-row
+        writes wrap themselves in an explicit BEGIN.
+        """
+        if self.conn is not None:
+            return self.conn
+
+        self.conn = self._open_connection()
+
+        # WAL keeps commits from syncing the main database file and lets
+        # readers proceed while a write is in progress; NORMAL synchronous
+        # is safe under WAL and avoids an fsync per commit
+        self.conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+        ''')
         return self.conn
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection to the database with the shared settings."""
+        conn = sqlite3.connect(self.db_name, check_same_thread=False,
+                               isolation_level=None,
+                               cached_statements=_STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+
+        # The 64 MiB page cache and 256 MiB memory map keep index pages
+        # hot across report queries
+        conn.executescript('''
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+        ''')
+        return conn
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """
+        Provide the connection queries should run on for the calling thread.
+
+        Each thread gets a read-only connection of its own, opened on first
+        use. With auto_commit off, queries use the writer connection so they
+        see the writes still pending there; an in-memory database cannot be
+        shared between connections, so it always uses the writer. Queries
+        on the shared writer hold the write lock like writes do.
+        """
+        if not self.auto_commit or self.db_name == ':memory:':
+            with self._write_lock:
+                yield self.conn
+            return
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open_connection()
+            conn.execute('PRAGMA query_only=1')
+            with self._write_lock:
+                self._readers.append(conn)
+                self._local.conn = conn
+        yield conn
+
+    @contextmanager
+    def read_snapshot(self) -> Iterator[None]:
+        """
+        Run the calling thread's queries in the block against one state of the data.
+
+        On a per-thread connection the queries share one read transaction,
+        so commits made meanwhile stay invisible to them. On the shared
+        writer connection, other threads' writes wait until the block ends.
+        """
+        if not self.auto_commit or self.db_name == ':memory:':
+            with self._write_lock:
+                yield
+            return
+
+        with self._reading() as conn:
+            if conn.in_transaction:
+                yield
+                return
+
+            conn.execute('BEGIN')
+            try:
+                yield
+            finally:
+                conn.commit()
+
     def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
+        """Commit any pending writes and close all database connections."""
+        with self._write_lock:
+            if self.conn:
+                self.task_done()
+                self.conn.close()
+                self.conn = None
+
+            for conn in self._readers:
+                conn.close()
+            self._readers = []
+            self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and self.conn and self.conn.in_transaction:
+            with self._write_lock:
+                self.conn.rollback()
+        self.close()
+
+    def task_done(self):
+        """Commit writes made since the last commit when auto_commit is off."""
+        with self._write_lock:
+            if self.conn.in_transaction:
+                self.conn.commit()
+
+    def _begin_deferred(self):
+        """Open the transaction that collects writes until task_done()."""
+        if not self.conn.in_transaction:
+            self.conn.execute('BEGIN')
 
     def create_tables(self):
         """Create necessary tables if they don't exist."""
-        conn = self.connect()
-        cursor = conn.cursor()
-
-        # Create transactions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                type TEXT NOT NULL CHECK(type IN ('income', 'expense')),
-                category TEXT NOT NULL,
-                amount REAL NOT NULL CHECK(amount > 0),
-                description TEXT
-            )
-        ''')
-
-        conn.commit()
-        self.close()
+        with self._write_lock:
+            self.conn.executescript('''
+                CREATE TABLE IF NOT EXISTS transactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date TEXT NOT NULL,
+                    type TEXT NOT NULL CHECK(type IN ('income', 'expense')),
+                    category TEXT NOT NULL,
+                    amount REAL NOT NULL CHECK(amount > 0),
+                    description TEXT
+                );
+
+                -- Index matching the newest-first ordering used for paging
+                CREATE INDEX IF NOT EXISTS idx_tx_date
+                ON transactions (date DESC, id DESC);
+
+                -- Date-range aggregates skip-scan idx_tx_type_date_cat across
+                -- the two types just as fast, so the (date, type, category,
+                -- amount) index earlier versions created only slowed writes
+                DROP INDEX IF EXISTS idx_tx_date_type_cat;
+
+                -- Covering index for per-type totals and category breakdowns
+                -- limited to a date range; supersedes the (type, date)
+                -- idx_tx_type_date that earlier versions created
+                DROP INDEX IF EXISTS idx_tx_type_date;
+                CREATE INDEX IF NOT EXISTS idx_tx_type_date_cat
+                ON transactions (type, date, category, amount);
+
+                -- Covering index for all-time per-category totals, grouped in
+                -- index order
+                CREATE INDEX IF NOT EXISTS idx_tx_type_cat
+                ON transactions (type, category, amount);
+            ''')
 
     def add_transaction(self, date: str, trans_type: str, category: str,
                        amount: float, description: str = "") -> int:
@@ -63,76 +336,234 @@ class AccountingDB:
         Returns:
             ID of the inserted transaction
         """
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            if not self.auto_commit:
+                self._begin_deferred()
 
-        cursor.execute('''
-            INSERT INTO transactions (date, type, category, amount, description)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (date, trans_type, category, amount, description))
+            cursor = self.conn.execute(
+                _SQL_ADD, (date, trans_type, category, amount, description)
+            )
 
-        trans_id = cursor.lastrowid
-        conn.commit()
-        self.close()
+            trans_id = cursor.lastrowid
+            self._db_version += 1
 
         return trans_id
 
-    def get_all_transactions(self, order_by: str = "date DESC") -> List[Dict]:
+    def add_transactions(self, rows: Iterable[Tuple[str, str, str, float, str]]) -> int:
+        """
+        Add many transactions in a single database transaction.
+
+        Args:
+            rows: Iterable of (date, trans_type, category, amount, description)
+                tuples
+
+        Returns:
+            Number of inserted transactions
+        """
+        with self._write_lock:
+            if self.auto_commit:
+                # Autocommit would commit each row; group them under one BEGIN
+                with self.conn:
+                    self.conn.execute('BEGIN')
+                    cursor = self.conn.executemany(_SQL_ADD, rows)
+            else:
+                self._begin_deferred()
+                cursor = self.conn.executemany(_SQL_ADD, rows)
+            count = cursor.rowcount
+            self._db_version += 1
+
+        return count
+
+    def add_transactions_bulk(self, rows: Iterable[Tuple[str, str, str, float, str]],
+                              batch_size: int = 10000) -> Tuple[int, int]:
+        """
+        Import many transactions, committing once per batch.
+
+        A batch containing an invalid row is rolled back as a whole and
+        its rows are counted as failed; the remaining batches are still
+        imported. Batches are committed even when auto_commit is off, and
+        any writes pending from earlier calls are committed first.
+
+        Args:
+            rows: Iterable of (date, trans_type, category, amount, description)
+                tuples
+            batch_size: Maximum number of rows per database transaction
+
+        Returns:
+            Tuple of (imported, failed) row counts
+        """
+        imported = failed = 0
+        rows = iter(rows)
+
+        with self._write_lock:
+            self.task_done()
+            conn = self.conn
+
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+
+                # Full chunks go through one multi-row INSERT each; any
+                # trailing partial chunk uses the single-row statement
+                num_full = len(batch) - len(batch) % _MULTI_INSERT_ROWS
+                try:
+                    conn.execute('BEGIN')
+                    for start in range(0, num_full, _MULTI_INSERT_ROWS):
+                        chunk = batch[start:start + _MULTI_INSERT_ROWS]
+                        conn.execute(_SQL_ADD_MULTI, list(chain.from_iterable(chunk)))
+                    conn.executemany(_SQL_ADD, batch[num_full:])
+                    conn.commit()
+                    imported += len(batch)
+                except sqlite3.Error:
+                    conn.rollback()
+                    failed += len(batch)
+                except BaseException:
+                    # Never leave the writer inside the failed batch
+                    conn.rollback()
+                    if imported:
+                        self._db_version += 1
+                    raise
+
+            if imported:
+                # Rescan for fresh planner statistics only when the import
+                # made up at least half the table; otherwise let SQLite
+                # decide whether its existing statistics need refreshing
+                total = conn.execute(_SQL_COUNT).fetchone()[0]
+                if imported * 2 >= total:
+                    conn.execute('ANALYZE')
+                else:
+                    conn.execute('PRAGMA optimize')
+
+                self._db_version += 1
+
+        return imported, failed
+
+    @staticmethod
+    def to_dicts(rows: Iterable[sqlite3.Row]) -> Iterator[Dict[str, Any]]:
+        """
+        Convert rows to dictionaries one at a time.
+
+        Rows returned by this class support lookup by column name and
+        index already; use this only where a real dict is needed.
+
+        Args:
+            rows: Rows from any of the transaction queries
+
+        Yields:
+            Transaction dictionaries
+        """
+        for row in rows:
+            yield dict(row)
+
+    def get_all_transactions(self, order_by: str = "date_desc") -> List[sqlite3.Row]:
         """
         Retrieve all transactions from the database.
 
         Args:
-            order_by: SQL ORDER BY clause
+            order_by: Sort order: 'date_desc', 'date_asc', 'amount_desc'
+                or 'id_desc'
 
         Returns:
-            List of transaction dictionaries
+            List of transaction rows
+
+        Raises:
+            ValueError: If order_by is not one of the supported sort orders
         """
-        conn = self.connect()
-        cursor = conn.cursor()
+        sql = _SQL_ALL_ORDERED.get(order_by)
+        if sql is None:
+            raise ValueError(
+                f"Unsupported order_by {order_by!r}; "
+                f"expected one of {', '.join(_SQL_ALL_ORDERED)}"
+            )
 
-        cursor.execute(f'''
-            SELECT id, date, type, category, amount, description
-            FROM transactions
-            ORDER BY {order_by}
-        ''')
+        return list(self._iter_rows(sql))
 
-        transactions = [dict(row) for row in cursor.fetchall()]
-        self.close()
+    def get_transactions_page(self, offset: int = 0, limit: int = 200) -> List[sqlite3.Row]:
+        """
+        Retrieve one page of transactions, newest first.
+
+        Args:
+            offset: Number of transactions to skip
+            limit: Maximum number of transactions to return
+
+        Returns:
+            List of transaction rows
+        """
+        with self._reading() as conn:
+            transactions = conn.execute(_SQL_PAGE, (limit, offset)).fetchall()
 
         return transactions
 
-    def get_transactions_by_type(self, trans_type: str) -> List[Dict]:
-        """Get all transactions of a specific type."""
-        conn = self.connect()
-        cursor = conn.cursor()
+    def iter_transactions(self, start_date: Optional[str] = None,
+                          end_date: Optional[str] = None,
+                          batch_size: int = 10000) -> Iterator[sqlite3.Row]:
+        """
+        Stream transactions newest first, optionally within a date range.
 
-        cursor.execute('''
-            SELECT id, date, type, category, amount, description
-            FROM transactions
-            WHERE type = ?
-            ORDER BY date DESC
-        ''', (trans_type,))
+        Rows are fetched from SQLite in batches, so the full result set is
+        never held in memory.
 
-        transactions = [dict(row) for row in cursor.fetchall()]
-        self.close()
+        Args:
+            start_date: Optional start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+            batch_size: Number of rows fetched per batch
+
+        Yields:
+            Transaction rows
+        """
+        if start_date and end_date:
+            yield from self._iter_rows(_SQL_RANGE, (start_date, end_date), batch_size)
+        else:
+            yield from self._iter_rows(_SQL_ALL, (), batch_size)
+
+    def _iter_rows(self, sql: str, params: Tuple = (),
+                   batch_size: int = 10000) -> Iterator[sqlite3.Row]:
+        """Run a query and yield its rows, fetching batch_size rows at a time."""
+        # Use a cursor of its own so other calls made while this generator
+        # is suspended don't disturb the pending result set. The connection
+        # is only held per step, never while the generator is suspended
+        with self._reading() as conn:
+            cursor = conn.cursor()
+        cursor.arraysize = batch_size
+        try:
+            with self._reading():
+                cursor.execute(sql, params)
+
+            while True:
+                with self._reading():
+                    rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def count_transactions(self, start_date: Optional[str] = None,
+                           end_date: Optional[str] = None) -> int:
+        """Count transactions, optionally within a date range."""
+        with self._reading() as conn:
+            if start_date and end_date:
+                cursor = conn.execute(_SQL_COUNT_RANGE, (start_date, end_date))
+            else:
+                cursor = conn.execute(_SQL_COUNT)
+
+            count = cursor.fetchone()[0]
+
+        return count
+
+    def get_transactions_by_type(self, trans_type: str) -> List[sqlite3.Row]:
+        """Get all transactions of a specific type."""
+        with self._reading() as conn:
+            transactions = conn.execute(_SQL_BY_TYPE, (trans_type,)).fetchall()
 
         return transactions
 
     def get_transactions_by_date_range(self, start_date: str,
-                                       end_date: str) -> List[Dict]:
+                                       end_date: str) -> List[sqlite3.Row]:
         """Get transactions within a date range."""
-        conn = self.connect()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, date, type, category, amount, description
-            FROM transactions
-            WHERE date BETWEEN ? AND ?
-            ORDER BY date DESC
-        ''', (start_date, end_date))
-
-        transactions = [dict(row) for row in cursor.fetchall()]
-        self.close()
+        with self._reading() as conn:
+            transactions = conn.execute(_SQL_RANGE, (start_date, end_date)).fetchall()
 
         return transactions
 
@@ -146,120 +577,121 @@ class AccountingDB:
         Returns:
             True if deletion was successful
         """
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            if not self.auto_commit:
+                self._begin_deferred()
 
-        cursor.execute('DELETE FROM transactions WHERE id = ?', (trans_id,))
+            cursor = self.conn.execute(_SQL_DELETE, (trans_id,))
 
-        success = cursor.rowcount > 0
-        conn.commit()
-        self.close()
+            success = cursor.rowcount > 0
+            if success:
+                self._db_version += 1
 
         return success
 
-    def get_total_income(self, start_date: Optional[str] = None,
-                        end_date: Optional[str] = None) -> float:
-        """Calculate total income, optionally within a date range."""
-        conn = self.connect()
-        cursor = conn.cursor()
-
-        if start_date and end_date:
-            cursor.execute('''
-                SELECT SUM(amount) FROM transactions
-                WHERE type = 'income' AND date BETWEEN ? AND ?
-            ''', (start_date, end_date))
-        else:
-            cursor.execute('''
-                SELECT SUM(amount) FROM transactions
-                WHERE type = 'income'
-            ''')
+    def _sum(self, trans_type: str, start_date: Optional[str] = None,
+             end_date: Optional[str] = None) -> float:
+        """Sum the amounts of one transaction type, optionally within a date range."""
+        with self._reading() as conn:
+            if start_date and end_date:
+                cursor = conn.execute(_SQL_TOTAL_RANGE, (trans_type, start_date, end_date))
+            else:
+                cursor = conn.execute(_SQL_TOTAL, (trans_type,))
 
-        result = cursor.fetchone()[0]
-        self.close()
+            result = cursor.fetchone()[0]
 
         return result if result else 0.0
 
+    def get_total_income(self, start_date: Optional[str] = None,
+                        end_date: Optional[str] = None) -> float:
+        """Calculate total income, optionally within a date range."""
+        return self._sum('income', start_date, end_date)
+
     def get_total_expenses(self, start_date: Optional[str] = None,
                           end_date: Optional[str] = None) -> float:
         """Calculate total expenses, optionally within a date range."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        return self._sum('expense', start_date, end_date)
 
-        if start_date and end_date:
-            cursor.execute('''
-                SELECT SUM(amount) FROM transactions
-                WHERE type = 'expense' AND date BETWEEN ? AND ?
-            ''', (start_date, end_date))
-        else:
-            cursor.execute('''
-                SELECT SUM(amount) FROM transactions
-                WHERE type = 'expense'
-            ''')
+    def get_totals(self) -> Tuple[float, float]:
+        """
+        Calculate all-time total income and expenses in one query.
 
-        result = cursor.fetchone()[0]
-        self.close()
+        The result is cached until the next write through this instance.
 
-        return result if result else 0.0
+        Returns:
+            Tuple of (total_income, total_expenses)
+        """
+        # Writes bump the version under the write lock, so holding it here
+        # keeps the cached totals matched to the version they were read at
+        with self._write_lock:
+            if self._cached_totals_version == self._db_version:
+                return self._cached_totals
+
+            with self._reading() as conn:
+                totals = dict(conn.execute(_SQL_TOTALS).fetchall())
+
+            self._cached_totals = (totals.get('income', 0.0), totals.get('expense', 0.0))
+            self._cached_totals_version = self._db_version
+
+            return self._cached_totals
 
     def get_balance(self, start_date: Optional[str] = None,
                    end_date: Optional[str] = None) -> float:
-        """Calculate balance (income - expenses)."""
-        income = self.get_total_income(start_date, end_date)
-        expenses = self.get_total_expenses(start_date, end_date)
-        return income - expenses
+        """Calculate balance (income - expenses) in a single query."""
+        with self._reading() as conn:
+            if start_date and end_date:
+                cursor = conn.execute(_SQL_BALANCE_RANGE, (start_date, end_date))
+            else:
+                cursor = conn.execute(_SQL_BALANCE)
+
+            result = cursor.fetchone()[0]
+
+        return result if result else 0.0
+
+    def get_report_aggregates(self, start_date: Optional[str] = None,
+                              end_date: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """
+        Get amount totals grouped by type and category in one query.
+
+        Args:
+            start_date: Optional start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+
+        Returns:
+            List of (type, category, total) tuples
+        """
+        with self._reading() as conn:
+            if start_date and end_date:
+                cursor = conn.execute(_SQL_REPORT_AGG_RANGE, (start_date, end_date))
+            else:
+                cursor = conn.execute(_SQL_REPORT_AGG)
+
+            results = cursor.fetchall()
+
+        return [(row[0], row[1], row[2]) for row in results]
 
     def get_expenses_by_category(self, start_date: Optional[str] = None,
                                  end_date: Optional[str] = None) -> List[Tuple[str, float]]:
         """Get expenses grouped by category."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._reading() as conn:
+            if start_date and end_date:
+                cursor = conn.execute(_SQL_BY_CAT_EXPENSE_RANGE, (start_date, end_date))
+            else:
+                cursor = conn.execute(_SQL_BY_CAT_EXPENSE)
 
-        if start_date and end_date:
-            cursor.execute('''
-                SELECT category, SUM(amount) as total
-                FROM transactions
-                WHERE type = 'expense' AND date BETWEEN ? AND ?
-                GROUP BY category
-                ORDER BY total DESC
-            ''', (start_date, end_date))
-        else:
-            cursor.execute('''
-                SELECT category, SUM(amount) as total
-                FROM transactions
-                WHERE type = 'expense'
-                GROUP BY category
-                ORDER BY total DESC
-            ''')
-
-        results = cursor.fetchall()
-        self.close()
+            results = cursor.fetchall()
 
         return [(row[0], row[1]) for row in results]
 
     def get_income_by_category(self, start_date: Optional[str] = None,
                                end_date: Optional[str] = None) -> List[Tuple[str, float]]:
         """Get income grouped by category."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._reading() as conn:
+            if start_date and end_date:
+                cursor = conn.execute(_SQL_BY_CAT_INCOME_RANGE, (start_date, end_date))
+            else:
+                cursor = conn.execute(_SQL_BY_CAT_INCOME)
 
-        if start_date and end_date:
-            cursor.execute('''
-                SELECT category, SUM(amount) as total
-                FROM transactions
-                WHERE type = 'income' AND date BETWEEN ? AND ?
-                GROUP BY category
-                ORDER BY total DESC
-            ''', (start_date, end_date))
-        else:
-            cursor.execute('''
-                SELECT category, SUM(amount) as total
-                FROM transactions
-                WHERE type = 'income'
-                GROUP BY category
-                ORDER BY total DESC
-            ''')
-
-        results = cursor.fetchall()
-        self.close()
+            results = cursor.fetchall()
 
         return [(row[0], row[1]) for row in results]
@@ -2,11 +2,28 @@
 Reports module for generating financial summaries.
 """
 
+import io
 from datetime import datetime
-from typing import Optional
+from operator import itemgetter
+from typing import Iterator, Optional
 from database import AccountingDB
 
 
+# Report separators
+SEP60 = "=" * 60
+DASH60 = "-" * 60
+SEP80 = "=" * 80
+DASH80 = "-" * 80
+
+TRANSACTIONS_HEADER = (
+    f"{'Date':<12} {'Type':<10} {'Category':<20} {'Amount':>12} {'Description':<20}"
+)
+_transaction_row = (
+    "{date:<12} {type:<10} {category:<20} {amount:>12} {description:<20}\n".format
+)
+_category_row = "{:.<30} ${:>10,.2f} ({:>5.1f}%)\n".format
+
+
 class ReportGenerator:
     """Generates financial reports from transaction data."""
 
@@ -26,59 +43,59 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
-        total_income = self.db.get_total_income(start_date, end_date)
-        total_expenses = self.db.get_total_expenses(start_date, end_date)
-        balance = self.db.get_balance(start_date, end_date)
+        # Get totals and category breakdowns from a single query
+        income, expenses = {}, {}
+        for trans_type, category, total in self.db.get_report_aggregates(start_date, end_date):
+            (income if trans_type == 'income' else expenses)[category] = total
+
+        total_income = sum(income.values())
+        total_expenses = sum(expenses.values())
+        balance = total_income - total_expenses
 
-        # Get category breakdowns
-        income_by_category = self.db.get_income_by_category(start_date, end_date)
-        expenses_by_category = self.db.get_expenses_by_category(start_date, end_date)
+        income_by_category = sorted(income.items(), key=itemgetter(1), reverse=True)
+        expenses_by_category = sorted(expenses.items(), key=itemgetter(1), reverse=True)
 
         # Build report
-        report = []
-        report.append("=" * 60)
-        report.append("FINANCIAL SUMMARY REPORT")
-        report.append("=" * 60)
+        buf = io.StringIO()
+        write = buf.write
+        write(f"{SEP60}\nFINANCIAL SUMMARY REPORT\n{SEP60}\n")
 
         if start_date and end_date:
-            report.append(f"Period: {start_date} to {end_date}")
+            write(f"Period: {start_date} to {end_date}\n")
         else:
-            report.append("Period: All Time")
+            write("Period: All Time\n")
 
-        report.append("")
-        report.append("-" * 60)
-        report.append("OVERVIEW")
-        report.append("-" * 60)
-        report.append(f"Total Income:        ${total_income:,.2f}")
-        report.append(f"Total Expenses:      ${total_expenses:,.2f}")
-        report.append(f"Net Balance:         ${balance:,.2f}")
-        report.append("")
+        write(
+            f"\n{DASH60}\nOVERVIEW\n{DASH60}\n"
+            f"Total Income:        ${total_income:,.2f}\n"
+            f"Total Expenses:      ${total_expenses:,.2f}\n"
+            f"Net Balance:         ${balance:,.2f}\n"
+            "\n"
+        )
 
         # Income breakdown
         if income_by_category:
-            report.append("-" * 60)
-            report.append("INCOME BY CATEGORY")
-            report.append("-" * 60)
+            write(f"{DASH60}\nINCOME BY CATEGORY\n{DASH60}\n")
             for category, amount in income_by_category:
                 percentage = (amount / total_income * 100) if total_income > 0 else 0
-                report.append(f"{category:.<30} ${amount:>10,.2f} ({percentage:>5.1f}%)")
-            report.append("")
+                write(_category_row(category, amount, percentage))
+            write("\n")
 
         # Expenses breakdown
         if expenses_by_category:
-            report.append("-" * 60)
-            report.append("EXPENSES BY CATEGORY")
-            report.append("-" * 60)
+            write(f"{DASH60}\nEXPENSES BY CATEGORY\n{DASH60}\n")
             for category, amount in expenses_by_category:
                 percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
-                report.append(f"{category:.<30} ${amount:>10,.2f} ({percentage:>5.1f}%)")
-            report.append("")
+                write(_category_row(category, amount, percentage))
+            write("\n")
 
-        report.append("=" * 60)
-        report.append(f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("=" * 60)
+        write(
+            f"{SEP60}\n"
+            f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{SEP60}"
+        )
 
-        return "\n".join(report)
+        return buf.getvalue()
 
     def generate_transactions_report(self, start_date: Optional[str] = None,
                                     end_date: Optional[str] = None) -> str:
@@ -92,54 +109,54 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
-        if start_date and end_date:
-            transactions = self.db.get_transactions_by_date_range(start_date, end_date)
-        else:
-            transactions = self.db.get_all_transactions()
+        return "".join(self.generate_transactions_report_iter(start_date, end_date))
 
-        report = []
-        report.append("=" * 80)
-        report.append("DETAILED TRANSACTIONS REPORT")
-        report.append("=" * 80)
+    def generate_transactions_report_iter(self, start_date: Optional[str] = None,
+                                         end_date: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate a detailed transactions report line by line.
 
-        if start_date and end_date:
-            report.append(f"Period: {start_date} to {end_date}")
-        else:
-            report.append("Period: All Time")
-
-        report.append("")
-        report.append(f"Total Transactions: {len(transactions)}")
-        report.append("")
-
-        if transactions:
-            report.append("-" * 80)
-            report.append(f"{'Date':<12} {'Type':<10} {'Category':<20} {'Amount':>12} {'Description':<20}")
-            report.append("-" * 80)
-
-            for trans in transactions:
-                trans_type = trans['type'].upper()
-                amount = trans['amount']
-                # Format amount with sign
-                if trans['type'] == 'expense':
-                    amount_str = f"-${amount:,.2f}"
-                else:
-                    amount_str = f"+${amount:,.2f}"
-
-                description = trans['description'][:20] if trans['description'] else ""
-
-                report.append(
-                    f"{trans['date']:<12} "
-                    f"{trans_type:<10} "
-                    f"{trans['category']:<20} "
-                    f"{amount_str:>12} "
-                    f"{description:<20}"
-                )
-
-        report.append("-" * 80)
-        report.append(f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("=" * 80)
-
-        return "\n".join(report)
+        Transactions are streamed from the database, so the full report
+        is never held in memory.
+
+        Args:
+            start_date: Optional start date (YYYY-MM-DD)
+            end_date: Optional end date (YYYY-MM-DD)
+
+        Yields:
+            Report lines, each ending in a newline except the last
+        """
+        # Count and rows come from the same snapshot, so the header always
+        # matches the rows listed under it
+        with self.db.read_snapshot():
+            num_transactions = self.db.count_transactions(start_date, end_date)
+
+            yield f"{SEP80}\nDETAILED TRANSACTIONS REPORT\n{SEP80}\n"
+
+            if start_date and end_date:
+                yield f"Period: {start_date} to {end_date}\n"
+            else:
+                yield "Period: All Time\n"
+
+            yield f"\nTotal Transactions: {num_transactions}\n\n"
+
+            if num_transactions:
+                yield f"{DASH80}\n{TRANSACTIONS_HEADER}\n{DASH80}\n"
+
+                for trans in self.db.iter_transactions(start_date, end_date):
+                    # Format amount with sign
+                    sign = '-' if trans['type'] == 'expense' else '+'
+                    yield _transaction_row(
+                        date=trans['date'],
+                        type=trans['type'].upper(),
+                        category=trans['category'],
+                        amount=f"{sign}${trans['amount']:,.2f}",
+                        description=(trans['description'] or "")[:20]
+                    )
+
+            yield f"{DASH80}\n"
+            yield f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            yield SEP80
 
     def export_report_to_file(self, report: str, filename: str) -> bool:
         """
@@ -4,6 +4,8 @@ Tests database and reports functionality.
 """
 
 import os
+import sqlite3
+import threading
 from datetime import datetime
 from database import AccountingDB
 from reports import ReportGenerator
@@ -59,6 +61,30 @@ def test_database():
     assert len(all_trans) == 3, f"Expected 3 transactions, got {len(all_trans)}"
     print(f"✓ Retrieved all transactions: {len(all_trans)}")
 
+    oldest_first = db.get_all_transactions("date_asc")
+    assert oldest_first == all_trans[::-1], "date_asc did not reverse the default order"
+    by_amount = db.get_all_transactions("amount_desc")
+    assert [t['amount'] for t in by_amount] == [5000.00, 200.00, 150.50], "amount_desc order wrong"
+
+    try:
+        db.get_all_transactions("date; DROP TABLE transactions")
+        assert False, "Unsupported order_by was accepted"
+    except ValueError:
+        pass
+    print("✓ Retrieved all transactions oldest first and by amount")
+
+    as_dicts = list(db.to_dicts(all_trans))
+    assert as_dicts[0] == dict(all_trans[0]), "to_dicts changed the row contents"
+    assert as_dicts[0]['id'] == trans_id3, f"Unexpected newest transaction: {as_dicts[0]}"
+    print("✓ Converted rows to dictionaries")
+
+    # Test paging (newest first)
+    page = db.get_transactions_page(0, 2)
+    assert [t['id'] for t in page] == [trans_id3, trans_id2], f"Unexpected first page: {page}"
+    page = db.get_transactions_page(2, 2)
+    assert [t['id'] for t in page] == [trans_id1], f"Unexpected second page: {page}"
+    print("✓ Retrieved transactions page by page")
+
     # Test retrieving by type
     income_trans = db.get_transactions_by_type("income")
     assert len(income_trans) == 1, f"Expected 1 income transaction, got {len(income_trans)}"
@@ -82,11 +108,28 @@ def test_database():
     assert balance == expected_balance, f"Expected balance {expected_balance}, got {balance}"
     print(f"✓ Net balance: ${balance:.2f}")
 
+    range_balance = db.get_balance("2025-01-16", "2025-01-17")
+    assert range_balance == -350.50, f"Expected range balance -350.50, got {range_balance}"
+    print(f"✓ Date range balance: ${range_balance:.2f}")
+
+    totals = db.get_totals()
+    assert totals == (5000.00, 350.50), f"Expected totals (5000.00, 350.50), got {totals}"
+    print(f"✓ Combined totals: {totals}")
+
     # Test category grouping
     expenses_by_cat = db.get_expenses_by_category()
     assert len(expenses_by_cat) == 2, f"Expected 2 expense categories, got {len(expenses_by_cat)}"
     print(f"✓ Expenses by category: {expenses_by_cat}")
 
+    aggregates = sorted(db.get_report_aggregates())
+    expected = [
+        ("expense", "Groceries", 150.50),
+        ("expense", "Utilities", 200.00),
+        ("income", "Salary", 5000.00),
+    ]
+    assert aggregates == expected, f"Expected aggregates {expected}, got {aggregates}"
+    print(f"✓ Report aggregates: {aggregates}")
+
     # Test deletion
     deleted = db.delete_transaction(trans_id2)
     assert deleted, "Failed to delete transaction"
@@ -96,7 +139,12 @@ def test_database():
     assert len(remaining) == 2, f"Expected 2 remaining transactions, got {len(remaining)}"
     print(f"✓ Remaining transactions: {len(remaining)}")
 
+    totals = db.get_totals()
+    assert totals == (5000.00, 200.00), f"Cached totals not refreshed after delete: {totals}"
+    print("✓ Combined totals refreshed after delete")
+
     # Clean up
+    db.close()
     if os.path.exists(test_db):
         os.remove(test_db)
     print("✓ Test database cleaned up")
@@ -158,6 +206,18 @@ def test_reports():
     assert os.path.exists(test_report_file), "Report file not created"
     print(f"✓ Report exported to {test_report_file}")
 
+    # A write committed while the report streams shows up in neither the
+    # header count nor the rows
+    lines = report_gen.generate_transactions_report_iter()
+    streamed = [next(lines) for _ in range(3)]
+    db.add_transaction("2025-01-31", "expense", "Late", 1.00, "After the count")
+    streamed.extend(lines)
+    streamed_report = "".join(streamed)
+    num_rows = sum(1 for line in streamed if line.startswith("2025-"))
+    assert f"Total Transactions: {num_rows}\n" in streamed_report, "Header count differs from rows"
+    assert "After the count" not in streamed_report, "Report saw a later write"
+    print("✓ Streamed transactions report reads one snapshot")
+
     # Print sample report
     print("\n" + "="*60)
     print("SAMPLE SUMMARY REPORT:")
@@ -166,6 +226,7 @@ def test_reports():
     print("="*60 + "\n")
 
     # Clean up
+    db.close()
     if os.path.exists(test_db):
         os.remove(test_db)
     if os.path.exists(test_report_file):
@@ -175,6 +236,85 @@ def test_reports():
     print("\n✅ All report tests passed!\n")
 
 
+def test_bulk_insert():
+    """Test inserting many transactions at once."""
+    print("Testing bulk insert...")
+
+    test_db = "test_accounting.db"
+
+    # Clean up if exists
+    if os.path.exists(test_db):
+        os.remove(test_db)
+
+    db = AccountingDB(test_db)
+
+    rows = [
+        ("2025-02-01", "income", "Salary", 5000.00, "February salary"),
+        ("2025-02-03", "expense", "Rent", 1500.00, "Monthly rent"),
+        ("2025-02-04", "expense", "Groceries", 120.25, ""),
+    ]
+    inserted = db.add_transactions(rows)
+    assert inserted == 3, f"Expected 3 inserted transactions, got {inserted}"
+    print(f"✓ Bulk inserted transactions: {inserted}")
+
+    all_trans = db.get_all_transactions()
+    assert len(all_trans) == 3, f"Expected 3 transactions, got {len(all_trans)}"
+    assert db.get_total_expenses() == 1620.25, "Bulk inserted expenses not summed"
+    print("✓ Bulk inserted transactions are queryable")
+
+    # Batches are committed independently; a batch with a bad row is skipped
+    rows = [
+        ("2025-03-01", "income", "Salary", 5000.00, "March salary"),
+        ("2025-03-02", "expense", "Dining", 45.00, "Dinner"),
+        ("2025-03-03", "expense", "Dining", -1.00, "Invalid amount"),
+        ("2025-03-04", "expense", "Shopping", 80.00, "Shoes"),
+        ("2025-03-05", "expense", "Utilities", 60.00, "Water"),
+    ]
+    imported, failed = db.add_transactions_bulk(rows, batch_size=2)
+    assert (imported, failed) == (3, 2), f"Expected (3, 2) imported/failed, got {(imported, failed)}"
+    assert len(db.get_all_transactions()) == 6, "Failed batch was not rolled back"
+    print(f"✓ Batched import: {imported} imported, {failed} failed")
+
+    # Large imports use multi-row INSERTs plus a single-row tail
+    rows = [("2025-04-01", "expense", "Groceries", 1.00, f"Item {i}") for i in range(250)]
+    imported, failed = db.add_transactions_bulk(rows)
+    assert (imported, failed) == (250, 0), f"Expected (250, 0) imported/failed, got {(imported, failed)}"
+    assert len(db.get_all_transactions()) == 256, "Multi-row import lost rows"
+    print(f"✓ Multi-row import: {imported} imported")
+
+    # Malformed rows abort the import without leaving a transaction open
+    try:
+        db.add_transactions_bulk(rows[:99] + [None])
+        assert False, "Malformed row was accepted"
+    except TypeError:
+        pass
+    assert not db.conn.in_transaction, "Aborted import left a transaction open"
+    assert len(db.get_all_transactions()) == 256, "Aborted import was not rolled back"
+    print("✓ Aborted import rolled back")
+
+    # With auto_commit off, writes stay uncommitted until task_done()
+    db.close()
+    deferred_db = AccountingDB(test_db, auto_commit=False)
+    deferred_db.add_transaction("2025-05-01", "income", "Gift", 50.00, "Birthday")
+    deferred_db.add_transactions(rows[:10])
+    reader = sqlite3.connect(test_db)
+    count = reader.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+    assert count == 256, f"Deferred writes visible before task_done: {count}"
+    deferred_db.task_done()
+    count = reader.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+    assert count == 267, f"Expected 267 transactions after task_done, got {count}"
+    reader.close()
+    db = deferred_db
+    print("✓ Deferred writes committed by task_done")
+
+    # Clean up
+    db.close()
+    if os.path.exists(test_db):
+        os.remove(test_db)
+
+    print("\n✅ All bulk insert tests passed!\n")
+
+
 def test_edge_cases():
     """Test edge cases and error handling."""
     print("Testing edge cases...")
@@ -194,6 +334,9 @@ def test_edge_cases():
 
     balance = db.get_balance()
     assert balance == 0.0, f"Expected 0 balance for empty DB, got {balance}"
+
+    totals = db.get_totals()
+    assert totals == (0.0, 0.0), f"Expected zero totals for empty DB, got {totals}"
     print("✓ Empty database returns 0 for balance")
 
     all_trans = db.get_all_transactions()
@@ -205,6 +348,73 @@ def test_edge_cases():
     assert not deleted, "Should return False when deleting non-existent transaction"
     print("✓ Deleting non-existent transaction returns False")
 
+    # The context manager closes the shared connection
+    db.close()
+    with AccountingDB(test_db) as scoped_db:
+        assert scoped_db.count_transactions() == 0, "Expected empty DB in with block"
+    assert scoped_db.conn is None, "Connection left open after with block"
+    print("✓ Context manager closes the connection")
+
+    # Other threads read through connections of their own
+    db = AccountingDB(test_db)
+    db.add_transaction("2025-06-01", "income", "Salary", 100.00, "June")
+    counts = []
+    reader = threading.Thread(target=lambda: counts.append(db.count_transactions()))
+    reader.start()
+    reader.join()
+    assert counts == [1], f"Reader thread did not see committed write: {counts}"
+    assert db.count_transactions() == 1, "Main thread did not see committed write"
+    db.close()
+    print("✓ Reader threads see committed writes")
+
+
+    # Same-day transactions come back newest first everywhere
+    with AccountingDB(test_db) as db:
+        first = db.add_transaction("2025-06-01", "expense", "Dining", 10.00, "Lunch")
+        second = db.add_transaction("2025-06-01", "expense", "Dining", 20.00, "Dinner")
+        expected = [second, first]
+        for rows in (db.get_all_transactions(), db.get_transactions_page(),
+                     db.get_transactions_by_date_range("2025-06-01", "2025-06-01"),
+                     db.get_transactions_by_type("expense")):
+            ids = [t['id'] for t in rows if t['id'] in expected]
+            assert ids == expected, f"Unexpected same-day order: {ids}"
+    print("✓ Same-day transactions ordered consistently")
+
+    # Reads from other threads during a bulk import see whole batches only,
+    # whether each thread has a connection of its own or they share the writer
+    for label, kwargs in (("file", {'db_name': test_db}),
+                          ("in-memory", {'db_name': ':memory:'}),
+                          ("deferred commit", {'db_name': test_db, 'auto_commit': False})):
+        db = AccountingDB(**kwargs)
+        start = db.count_transactions()
+        imported = []
+        counts, errors = [], []
+
+        def read_until_imported():
+            try:
+                while not imported:
+                    counts.append(db.count_transactions())
+                    db.get_totals()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read_until_imported) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        imported.append(db.add_transactions_bulk(
+            [("2025-07-01", "expense", "Bills", 1.00, "")] * 2000, batch_size=500
+        ))
+        for thread in threads:
+            thread.join()
+
+        assert not errors, f"Concurrent {label} reads raised: {errors}"
+        partial = {count - start for count in counts if (count - start) % 500}
+        assert not partial, f"{label} readers saw partial batches: {sorted(partial)}"
+        assert db.count_transactions() == start + 2000, f"{label} import incomplete"
+        assert db.get_totals()[1] == db.get_total_expenses(), f"Stale {label} totals"
+        db.close()
+    print("✓ Concurrent reads return consistent results")
+
     # Clean up
     if os.path.exists(test_db):
         os.remove(test_db)
@@ -212,6 +422,39 @@ def test_edge_cases():
     print("\n✅ All edge case tests passed!\n")
 
 
+def test_form_validation():
+    """Test that the add-transaction form accepts what strptime and float() do."""
+    print("Testing form validation...")
+
+    from accounting_app import _AMOUNT_RE, _valid_date
+
+    dates = ["2025-01-05", "2025-1-5", "2025-01- 5", "2024-02-29", "2025-02-29",
+             "2025-13-01", "2025-001-01", "25-01-05", "2025/01/05", "2025-01-05 x", ""]
+    for date in dates:
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+            expected = True
+        except ValueError:
+            expected = False
+        assert _valid_date(date) == expected, f"Date {date!r} should be {expected}"
+    print("✓ Dates validated like strptime")
+
+    amounts = ["12.50", "5", ".5", "3.", "1e3", "2.5E-1", "+5", "-5", "1_000",
+               "inf", "nan", "1__0", "_1", "1_", "1e", "e5", "1.2.3", "$5", "."]
+    for amount in amounts:
+        try:
+            float(amount)
+            expected = True
+        except ValueError:
+            expected = False
+        assert bool(_AMOUNT_RE.fullmatch(amount)) == expected, (
+            f"Amount {amount!r} should be {'accepted' if expected else 'rejected'}"
+        )
+    print("✓ Amounts validated like float()")
+
+    print("\n✅ All form validation tests passed!\n")
+
+
 def main():
     """Run all tests."""
     print("\n" + "="*60)
@@ -221,7 +464,9 @@ def main():
     try:
         test_database()
         test_reports()
+        test_bulk_insert()
         test_edge_cases()
+        test_form_validation()
 
         print("="*60)
         print("✅ ALL TESTS PASSED SUCCESSFULLY!")
@@ -6,12 +6,57 @@ volumetric ultrasound data with metadata about dimensions, spacing, and coordina
 system information.
 """
 
+import os
 import struct
 import numpy as np
 from typing import Tuple, Dict, Any, Optional
 from pathlib import Path
 
 
+# Header fields from offset 16: frame count (uint32), dimensions (3 x uint32),
+# spacing (3 x float32), coordinate system, data type and compression flag
+# (1 byte each, then 1 byte padding), patient name (64 bytes), study date and
+# time (16 bytes each), acquisition mode, system and probe names (32 bytes
+# each) and origin (3 x float32)
+_HEADER_STRUCT = struct.Struct('<I3I3f3Bx64s16s16s32s32s32s3f')
+_HEADER_FIELDS_OFFSET = 16
+
+_COORDINATE_SYSTEMS = {
+    0: 'cartesian',
+    1: 'toroidal',
+    2: 'spherical',
+    3: 'cylindrical'
+}
+
+_DATA_TYPES = {
+    0: 'uint8',
+    1: 'uint16',
+    2: 'uint32',
+    3: 'int8',
+    4: 'int16',
+    5: 'int32',
+    6: 'float32',
+    7: 'float64'
+}
+
+# Map data type strings to numpy dtypes
+_DTYPE_MAP = {
+    'uint8': np.uint8,
+    'uint16': np.uint16,
+    'uint32': np.uint32,
+    'int8': np.int8,
+    'int16': np.int16,
+    'int32': np.int32,
+    'float32': np.float32,
+    'float64': np.float64
+}
+
+
+def _cstr(buf: bytes) -> str:
+    """Decode a null-terminated, null-padded fixed-width string field."""
+    return buf.partition(b'\x00')[0].decode('utf-8', errors='replace')
+
+
 class KretzFileLoader:
     """
     Loader for binary Kretzfile format used in GE 3D ultrasound systems.
@@ -22,7 +67,8 @@ class KretzFileLoader:
 
     Attributes:
         metadata: Dictionary containing file metadata
-        volume: 3D numpy array of volumetric ultrasound data
+        volume: 3D numpy array of volumetric ultrasound data, read from the
+            file on first access unless preloaded
     """
 
     # Kretzfile magic string and version
@@ -31,12 +77,16 @@ class KretzFileLoader:
     # Standard header size for basic kretzfile
     HEADER_SIZE = 256
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, preload: bool = False):
         """
-        Initialize KretzFileLoader and load data from file.
+        Initialize KretzFileLoader and load metadata from file.
+
+        Only the header is read here; the volume data is read on first
+        access unless preload is set.
 
         Args:
             filepath: Path to the kretzfile binary file
+            preload: Read the volume data immediately
 
         Raises:
             FileNotFoundError: If the file does not exist
@@ -47,230 +97,208 @@ class KretzFileLoader:
             raise FileNotFoundError(f"File not found: {filepath}")
 
         self.metadata: Dict[str, Any] = {}
-        self.volume: Optional[np.ndarray] = None
+        self._volume: Optional[np.ndarray] = None
 
         self._load_file()
+        if preload:
+            self._load_volume()
+
+    @property
+    def volume(self) -> np.ndarray:
+        """3D volume data, read from the file on first access."""
+        if self._volume is None:
+            self._load_volume()
+        return self._volume
 
     def _load_file(self) -> None:
-        """Load and parse the kretzfile binary data."""
+        """Load and parse the kretzfile header."""
         with open(self.filepath, "rb") as f:
-            # Read and validate magic string
-            magic = f.read(9)
+            # Read the whole fixed-size header at once
+            header = f.read(self.HEADER_SIZE)
+
+            # Validate magic string
+            magic = header[:9]
             if magic != self.MAGIC_STRING:
                 raise ValueError(
                     f"Invalid Kretzfile format. Expected magic string "
                     f"'{self.MAGIC_STRING.decode()}', got '{magic.decode(errors='ignore')}'"
                 )
 
-            # Read version
-            version_bytes = f.read(3)
-            version = version_bytes.decode('ascii')
-            self.metadata['version'] = version
+            # Read version (followed by a space separator)
+            self.metadata['version'] = header[9:12].decode('ascii')
 
-            # Read null terminator (space)
-            f.read(1)
+            # Parse extended header with metadata
+            self._parse_header(header)
 
-            # Read extended header with metadata
-            self._parse_header(f)
+            # Flag a short file now so the metadata does not depend on
+            # whether the volume has been read yet
+            self._check_volume_size(f)
 
-            # Read volumetric data
+    def _load_volume(self) -> None:
+        """Load the volumetric data from the file."""
+        with open(self.filepath, "rb") as f:
             self._parse_volume_data(f)
 
-    def _parse_header(self, f) -> None:
+    def _parse_header(self, header: bytes) -> None:
         """Parse the Kretzfile header containing metadata."""
-        # Read frame count (4 bytes, little-endian uint32)
-        f.seek(16)
-        frame_data = f.read(4)
-        self.metadata['frame_count'] = struct.unpack('<I', frame_data)[0]
-
-        # Read voxel dimensions (12 bytes: 3 x uint32)
-        f.seek(20)
-        dims = struct.unpack('<III', f.read(12))
-        self.metadata['dimensions'] = {
-            'x': dims[0],
-            'y': dims[1],
-            'z': dims[2]
-        }
-
-        # Read voxel spacing (12 bytes: 3 x float32)
-        f.seek(32)
-        spacing = struct.unpack('<fff', f.read(12))
-        self.metadata['spacing'] = {
-            'x': spacing[0],
-            'y': spacing[1],
-            'z': spacing[2]
-        }
-
-        # Read coordinate system type (1 byte)
-        f.seek(44)
-        coord_type = struct.unpack('<B', f.read(1))[0]
-        coord_systems = {
-            0: 'cartesian',
-            1: 'toroidal',
-            2: 'spherical',
-            3: 'cylindrical'
-        }
-        self.metadata['coordinate_system'] = coord_systems.get(
+        (
+            frame_count,
+            dim_x, dim_y, dim_z,
+            spacing_x, spacing_y, spacing_z,
+            coord_type, data_type, compression,
+            patient_name, study_date, study_time,
+            acq_mode, system_name, probe_name,
+            origin_x, origin_y, origin_z,
+        ) = _HEADER_STRUCT.unpack_from(header, _HEADER_FIELDS_OFFSET)
+
+        self.metadata['frame_count'] = frame_count
+        self.metadata['dimensions'] = {'x': dim_x, 'y': dim_y, 'z': dim_z}
+        self.metadata['spacing'] = {'x': spacing_x, 'y': spacing_y, 'z': spacing_z}
+
+        self.metadata['coordinate_system'] = _COORDINATE_SYSTEMS.get(
             coord_type, f'unknown_{coord_type}'
         )
-
-        # Read image data type (1 byte)
-        f.seek(45)
-        data_type = struct.unpack('<B', f.read(1))[0]
-        data_types = {
-            0: 'uint8',
-            1: 'uint16',
-            2: 'uint32',
-            3: 'int8',
-            4: 'int16',
-            5: 'int32',
-            6: 'float32',
-            7: 'float64'
-        }
-        self.metadata['data_type'] = data_types.get(data_type, f'unknown_{data_type}')
-
-        # Read compression flag (1 byte)
-        f.seek(46)
-        compression = struct.unpack('<B', f.read(1))[0]
+        self.metadata['data_type'] = _DATA_TYPES.get(data_type, f'unknown_{data_type}')
         self.metadata['compressed'] = bool(compression)
 
-        # Read patient name (64 bytes, null-terminated string)
-        f.seek(48)
-        patient_name = f.read(64)
-        self.metadata['patient_name'] = patient_name.rstrip(b'\x00').decode(
-            'utf-8', errors='replace'
-        )
-
-        # Read study date (16 bytes)
-        f.seek(112)
-        study_date = f.read(16)
-        self.metadata['study_date'] = study_date.rstrip(b'\x00').decode(
-            'utf-8', errors='replace'
-        )
+        # Null-padded fixed-width strings
+        self.metadata['patient_name'] = _cstr(patient_name)
+        self.metadata['study_date'] = _cstr(study_date)
+        self.metadata['study_time'] = _cstr(study_time)
+        self.metadata['acquisition_mode'] = _cstr(acq_mode)
+        self.metadata['system_name'] = _cstr(system_name)
+        self.metadata['probe_name'] = _cstr(probe_name)
 
-        # Read study time (16 bytes)
-        f.seek(128)
-        study_time = f.read(16)
-        self.metadata['study_time'] = study_time.rstrip(b'\x00').decode(
-            'utf-8', errors='replace'
-        )
-
-        # Read acquisition mode (32 bytes)
-        f.seek(144)
-        acq_mode = f.read(32)
-        self.metadata['acquisition_mode'] = acq_mode.rstrip(b'\x00').decode(
-            'utf-8', errors='replace'
-        )
-
-        # Read system name (32 bytes)
-        f.seek(176)
-        system_name = f.read(32)
-        self.metadata['system_name'] = system_name.rstrip(b'\x00').decode(
-            'utf-8', errors='replace'
-        )
+        self.metadata['origin'] = {'x': origin_x, 'y': origin_y, 'z': origin_z}
 
-        # Read probe name (32 bytes)
-        f.seek(208)
-        probe_name = f.read(32)
-        self.metadata['probe_name'] = probe_name.rstrip(b'\x00').decode(
-            'utf-8', errors='replace'
-        )
+    def _check_volume_size(self, f) -> None:
+        """Mark the volume data missing if the file is too short to hold it."""
+        dims = self.metadata['dimensions']
+        num_voxels = dims['x'] * dims['y'] * dims['z']
+        if num_voxels == 0:
+            return
+
+        dtype = np.dtype(_DTYPE_MAP.get(self.metadata['data_type'], np.uint8))
+        if self.metadata['compressed']:
+            # Sum the run counts the decoder would use, without expanding them
+            f.seek(self.HEADER_SIZE)
+            _, counts = self._rle_runs(f.read(), dtype.itemsize, num_voxels)
+            complete = int(counts.sum(dtype=np.int64)) == num_voxels
+        else:
+            file_size = os.fstat(f.fileno()).st_size
+            complete = file_size >= self.HEADER_SIZE + num_voxels * dtype.itemsize
 
-        # Read additional parameters
-        f.seek(240)
-        origin = struct.unpack('<fff', f.read(12))
-        self.metadata['origin'] = {
-            'x': origin[0],
-            'y': origin[1],
-            'z': origin[2]
-        }
+        if not complete:
+            self.metadata['volume_data_missing'] = True
 
     def _parse_volume_data(self, f) -> None:
         """Parse the volumetric data from the file."""
         dims = self.metadata['dimensions']
         num_voxels = dims['x'] * dims['y'] * dims['z']
 
-        # Map data type strings to numpy dtypes
-        dtype_map = {
-            'uint8': np.uint8,
-            'uint16': np.uint16,
-            'uint32': np.uint32,
-            'int8': np.int8,
-            'int16': np.int16,
-            'int32': np.int32,
-            'float32': np.float32,
-            'float64': np.float64
-        }
-
         data_type_str = self.metadata['data_type']
-        dtype = dtype_map.get(data_type_str, np.uint8)
+        dtype = np.dtype(_DTYPE_MAP.get(data_type_str, np.uint8))
+
+        # Voxels are stored little-endian; reading them with an explicit
+        # byte order keeps the memmap and RLE views zero-copy on
+        # little-endian hosts and makes the swap on big-endian hosts a
+        # visible step below
+        file_dtype = dtype.newbyteorder('<')
 
         # Seek to volume data (after header)
         f.seek(self.HEADER_SIZE)
 
         # Read volume data
-        if self.metadata.get('compressed'):
+        if self.metadata.get('volume_data_missing') or num_voxels == 0:
+            # Too short for the dimensions (see _check_volume_size), or empty
+            volume_data = np.array([], dtype=dtype)
+        elif self.metadata.get('compressed'):
             # For compressed data, read all remaining bytes and decompress
             compressed_data = f.read()
-            if len(compressed_data) > 0:
-                # Simple RLE decompression for basic compression
-                volume_data = self._decompress_rle(compressed_data, dtype, num_voxels)
-            else:
-                # No data available, create empty volume
-                volume_data = np.array([], dtype=dtype)
+            volume_data = self._decompress_rle(compressed_data, file_dtype, num_voxels)
         else:
-            # Read uncompressed data
-            voxel_size = dtype(0).itemsize
-            volume_bytes = f.read(num_voxels * voxel_size)
-            volume_data = np.frombuffer(volume_bytes, dtype=dtype)
+            # Map the data block so pages are only read when accessed; the
+            # plain ndarray view keeps the public type independent of this
+            volume_data = np.asarray(np.memmap(
+                self.filepath, dtype=file_dtype, mode='r',
+                offset=self.HEADER_SIZE, shape=(num_voxels,)
+            ))
 
         # Reshape to 3D array (X, Y, Z) if data is available
         if len(volume_data) == num_voxels:
-            self.volume = volume_data.reshape(
+            # No-op on little-endian hosts; byteswaps into a copy otherwise
+            volume_data = volume_data.astype(dtype, copy=False)
+            self._volume = volume_data.reshape(
                 (dims['x'], dims['y'], dims['z']), order='C'
             )
         else:
             # Data size mismatch, create empty volume or warn
             self.metadata['volume_data_missing'] = True
-            self.volume = np.zeros((dims['x'], dims['y'], dims['z']), dtype=dtype)
+            self._volume = np.zeros((dims['x'], dims['y'], dims['z']), dtype=dtype)
+
+        # Only the memory map starts read-only; lock decoded, byteswapped
+        # and fallback arrays too
+        self._volume.setflags(write=False)
 
     @staticmethod
     def _decompress_rle(data: bytes, dtype: np.dtype, num_voxels: int) -> np.ndarray:
         """
         Decompress RLE (Run-Length Encoding) compressed data.
 
-        Simple RLE format: [count, value] pairs
+        Simple RLE format: [count, value] pairs, where count is a single
+        byte and a count of zero ends the stream. Decoding stops after the
+        run that reaches num_voxels.
 
         Args:
             data: Compressed byte data
-            dtype: Data type of individual voxels
+            dtype: Data type of individual voxels, with the byte order
+                they are stored in
             num_voxels: Expected number of voxels
 
         Returns:
             1D numpy array of decompressed voxel data
         """
-        result = []
-        i = 0
-        voxel_size = dtype(0).itemsize
-
-        while i < len(data) and len(result) < num_voxels:
-            # Read count (1 byte)
-            count = data[i]
-            i += 1
-
-            if count == 0:
-                break
+        records, counts = KretzFileLoader._rle_runs(
+            data, np.dtype(dtype).itemsize, num_voxels
+        )
+        values = np.ascontiguousarray(records[:, 1:]).view(dtype).ravel()
+        return np.repeat(values, counts)
 
-            # Read value
-            value_bytes = data[i:i + voxel_size]
-            if len(value_bytes) < voxel_size:
-                break
+    @staticmethod
+    def _rle_runs(data: bytes, voxel_size: int,
+                  num_voxels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split RLE data into the runs that decode to the volume.
 
-            value = np.frombuffer(value_bytes, dtype=dtype)[0]
-            result.extend([value] * count)
-            i += voxel_size
+        Args:
+            data: Compressed byte data
+            voxel_size: Size in bytes of one voxel value
+            num_voxels: Expected number of voxels
 
-        return np.array(result, dtype=dtype)
+        Returns:
+            Tuple of (records, counts): the [count, value] records as rows
+            of bytes, and their run lengths
+        """
+        stride = 1 + voxel_size
+        num_records = len(data) // stride if num_voxels > 0 else 0
+
+        # View the complete [count, value] records as rows; a trailing
+        # partial record is ignored
+        records = np.frombuffer(
+            data, dtype=np.uint8, count=num_records * stride
+        ).reshape(num_records, stride)
+        counts = records[:, 0]
+
+        # A zero count ends the stream
+        zeros = np.flatnonzero(counts == 0)
+        if zeros.size:
+            records = records[:zeros[0]]
+            counts = counts[:zeros[0]]
+
+        # Stop after the run that reaches num_voxels
+        run_ends = np.cumsum(counts, dtype=np.int64)
+        num_runs = np.searchsorted(run_ends, num_voxels) + 1
+        return records[:num_runs], counts[:num_runs]
 
     def get_metadata(self) -> Dict[str, Any]:
         """
@@ -281,16 +309,20 @@ class KretzFileLoader:
         """
         return self.metadata.copy()
 
-    def get_volume(self) -> np.ndarray:
+    def get_volume(self, copy: bool = True) -> np.ndarray:
         """
         Get the 3D volumetric ultrasound data.
 
+        Args:
+            copy: Return a writable copy. When False, the loader's own
+                read-only array is returned, which for uncompressed files
+                is memory-mapped from disk
+
         Returns:
             3D numpy array with shape (X, Y, Z) containing voxel intensities
         """
-        if self.volume is None:
-            raise RuntimeError("Volume data not loaded")
-        return self.volume.copy()
+        volume = self.volume
+        return volume.copy() if copy else volume
 
     def get_dimension(self) -> Tuple[int, int, int]:
         """
@@ -4,6 +4,8 @@ Unit tests for the kretzfile module.
 Tests cover loading, parsing metadata, accessing volume data, and error handling.
 """
 
+import os
+import shutil
 import unittest
 import tempfile
 import struct
@@ -12,17 +14,49 @@ from pathlib import Path
 from kretzfile import KretzFileLoader
 
 
+# Packers for the header fields written by the _create_test_file helpers
+_HDR_MAGIC = struct.Struct('<9s3sc')
+_HDR_FRAME_COUNT = struct.Struct('<I')
+_HDR_DIMS = struct.Struct('<III')
+_HDR_SPACING = struct.Struct('<fff')
+_HDR_FLAGS = struct.Struct('<BBB')
+_HDR_STRINGS = struct.Struct('<64s16s16s32s32s32s')
+_HDR_ORIGIN = struct.Struct('<fff')
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link src to dst, copying instead where links are unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 class TestKretzFileLoader(unittest.TestCase):
     """Test suite for KretzFileLoader class."""
 
+    # Generated files by _create_test_file arguments; each is written once
+    # per class and hard-linked (or copied) into the tests that ask for it
+    _file_cache: dict = {}
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the directory shared by the test and cached files."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared directory."""
+        cls._file_cache.clear()
+        cls.temp_dir.cleanup()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_file_path = Path(self.temp_dir.name) / "test.vol"
+        self.test_file_path = Path(self.temp_dir.name) / f"{self._testMethodName}_test.vol"
 
     def tearDown(self):
         """Clean up test fixtures."""
-        self.temp_dir.cleanup()
+        self.test_file_path.unlink(missing_ok=True)
 
     def _create_test_file(
         self,
@@ -37,7 +71,8 @@ class TestKretzFileLoader(unittest.TestCase):
         acquisition_mode: str = "3D",
         system_name: str = "GE Voluson",
         probe_name: str = "4D Probe",
-        write_volume_data: bool = True
+        write_volume_data: bool = True,
+        no_cache: bool = False
     ) -> Path:
         """
         Create a test kretzfile with specified parameters.
@@ -54,80 +89,65 @@ class TestKretzFileLoader(unittest.TestCase):
             acquisition_mode: Acquisition mode string
             system_name: System name string
             probe_name: Probe name string
-            write_volume_data: Whether to write volume data (set to False for compressed test)
+            write_volume_data: Whether to write volume data (set to False for tests
+                that only read the header)
+            no_cache: Write a private copy; set for tests that modify the file
 
         Returns:
             Path to created test file
         """
-        with open(self.test_file_path, 'wb') as f:
-            # Write magic string
-            f.write(b"KRETZFILE")
-
-            # Write version
-            f.write(b"1.0")
-
-            # Write space separator
-            f.write(b" ")
-
-            # Pad to offset 16
-            f.write(b'\x00' * (16 - f.tell()))
-
-            # Write frame count (offset 16)
-            f.write(struct.pack('<I', 1))
-
-            # Write dimensions (offset 20)
-            f.write(struct.pack('<III', dims[0], dims[1], dims[2]))
-
-            # Write spacing (offset 32)
-            f.write(struct.pack('<fff', spacing[0], spacing[1], spacing[2]))
-
-            # Write coordinate system (offset 44)
-            f.write(struct.pack('<B', coord_system))
-
-            # Write data type (offset 45)
-            f.write(struct.pack('<B', data_type))
-
-            # Write compression flag (offset 46)
-            f.write(struct.pack('<B', 1 if compressed else 0))
-
-            # Pad to offset 48
-            f.write(b'\x00' * (48 - f.tell()))
-
-            # Write patient name (offset 48, 64 bytes)
-            patient_bytes = patient_name.encode('utf-8')[:64]
-            f.write(patient_bytes)
-            f.write(b'\x00' * (64 - len(patient_bytes)))
-
-            # Write study date (offset 112, 16 bytes)
-            date_bytes = study_date.encode('utf-8')[:16]
-            f.write(date_bytes)
-            f.write(b'\x00' * (16 - len(date_bytes)))
-
-            # Write study time (offset 128, 16 bytes)
-            time_bytes = study_time.encode('utf-8')[:16]
-            f.write(time_bytes)
-            f.write(b'\x00' * (16 - len(time_bytes)))
-
-            # Write acquisition mode (offset 144, 32 bytes)
-            acq_bytes = acquisition_mode.encode('utf-8')[:32]
-            f.write(acq_bytes)
-            f.write(b'\x00' * (32 - len(acq_bytes)))
-
-            # Write system name (offset 176, 32 bytes)
-            sys_bytes = system_name.encode('utf-8')[:32]
-            f.write(sys_bytes)
-            f.write(b'\x00' * (32 - len(sys_bytes)))
+        key = (
+            dims, spacing, coord_system, data_type, compressed, patient_name,
+            study_date, study_time, acquisition_mode, system_name, probe_name,
+            write_volume_data
+        )
 
-            # Write probe name (offset 208, 32 bytes)
-            probe_bytes = probe_name.encode('utf-8')[:32]
-            f.write(probe_bytes)
-            f.write(b'\x00' * (32 - len(probe_bytes)))
+        # Never write through a link into a cached file
+        self.test_file_path.unlink(missing_ok=True)
+
+        if no_cache:
+            path = self.test_file_path
+        elif key in self._file_cache:
+            _link_or_copy(self._file_cache[key], self.test_file_path)
+            return self.test_file_path
+        else:
+            path = Path(self.temp_dir.name) / f"cache_{len(self._file_cache)}.vol"
+
+        # Assemble the zero-filled 256-byte header (HEADER_SIZE) in memory
+        header = bytearray(256)
+
+        # Magic string, version and space separator (offset 0)
+        _HDR_MAGIC.pack_into(header, 0, b"KRETZFILE", b"1.0", b" ")
+
+        # Frame count (offset 16)
+        _HDR_FRAME_COUNT.pack_into(header, 16, 1)
+
+        # Dimensions (offset 20)
+        _HDR_DIMS.pack_into(header, 20, dims[0], dims[1], dims[2])
+
+        # Spacing (offset 32)
+        _HDR_SPACING.pack_into(header, 32, spacing[0], spacing[1], spacing[2])
+
+        # Coordinate system, data type and compression flag (offset 44)
+        _HDR_FLAGS.pack_into(header, 44, coord_system, data_type,
+                             1 if compressed else 0)
+
+        # Null-padded strings: patient name (offset 48, 64 bytes), study
+        # date and time (offsets 112 and 128, 16 bytes each), acquisition
+        # mode, system and probe names (offsets 144, 176 and 208, 32 bytes
+        # each)
+        _HDR_STRINGS.pack_into(
+            header, 48,
+            patient_name.encode('utf-8'), study_date.encode('utf-8'),
+            study_time.encode('utf-8'), acquisition_mode.encode('utf-8'),
+            system_name.encode('utf-8'), probe_name.encode('utf-8')
+        )
 
-            # Write origin (offset 240, 12 bytes)
-            f.write(struct.pack('<fff', 0.0, 0.0, 0.0))
+        # Origin (offset 240, 12 bytes)
+        _HDR_ORIGIN.pack_into(header, 240, 0.0, 0.0, 0.0)
 
-            # Pad to offset 256 (HEADER_SIZE)
-            f.write(b'\x00' * (256 - f.tell()))
+        with open(path, 'wb', buffering=0) as f:
+            f.write(header)
 
             # Write volume data if requested
             if write_volume_data:
@@ -147,16 +167,22 @@ class TestKretzFileLoader(unittest.TestCase):
 
                 dtype = dtype_map.get(data_type, np.uint8)
 
+                # Unsigned arange wraps at 256 / 65536; signed types reuse
+                # the same bits
                 if dtype in (np.uint8, np.int8):
-                    volume_data = np.arange(num_voxels, dtype=np.int32) % 256
-                    volume_data = volume_data.astype(dtype)
+                    volume_data = np.arange(num_voxels, dtype=np.uint8).view(dtype)
                 elif dtype in (np.uint16, np.int16):
-                    volume_data = np.arange(num_voxels, dtype=np.int32) % 65536
-                    volume_data = volume_data.astype(dtype)
+                    volume_data = np.arange(num_voxels, dtype=np.uint16).view(dtype)
+                elif dtype in (np.uint32, np.int32):
+                    volume_data = np.arange(num_voxels, dtype=dtype)
                 else:
                     volume_data = np.arange(num_voxels, dtype=dtype) / 100.0
 
-                f.write(volume_data.tobytes())
+                volume_data.tofile(f)
+
+        if not no_cache:
+            self._file_cache[key] = path
+            _link_or_copy(path, self.test_file_path)
 
         return self.test_file_path
 
@@ -192,7 +218,8 @@ class TestKretzFileLoader(unittest.TestCase):
             patient_name="John Doe",
             study_date="2024-06-15",
             system_name="GE Vivid",
-            probe_name="4DHz"
+            probe_name="4DHz",
+            write_volume_data=False
         )
 
         loader = KretzFileLoader(str(self.test_file_path))
@@ -218,14 +245,21 @@ class TestKretzFileLoader(unittest.TestCase):
             (3, 'cylindrical')
         ]
 
+        # Write the header once and patch only the coordinate system byte
+        # (offset 44)
+        self._create_test_file(write_volume_data=False, no_cache=True)
+
         for coord_type, expected_name in test_cases:
-            self._create_test_file(coord_system=coord_type)
-            loader = KretzFileLoader(str(self.test_file_path))
-            self.assertEqual(
-                loader.get_coordinate_system(),
-                expected_name,
-                f"Coordinate system type {coord_type} not parsed correctly"
-            )
+            with self.subTest(coord_type=coord_type):
+                with open(self.test_file_path, 'r+b') as f:
+                    f.seek(44)
+                    f.write(bytes([coord_type]))
+                loader = KretzFileLoader(str(self.test_file_path))
+                self.assertEqual(
+                    loader.get_coordinate_system(),
+                    expected_name,
+                    f"Coordinate system type {coord_type} not parsed correctly"
+                )
 
     def test_data_type_parsing(self):
         """Test data type parsing."""
@@ -236,14 +270,21 @@ class TestKretzFileLoader(unittest.TestCase):
             (7, 'float64')
         ]
 
+        # Write the header once and patch only the data type byte
+        # (offset 45)
+        self._create_test_file(write_volume_data=False, no_cache=True)
+
         for type_code, expected_name in data_types:
-            self._create_test_file(data_type=type_code)
-            loader = KretzFileLoader(str(self.test_file_path))
-            self.assertEqual(
-                loader.metadata['data_type'],
-                expected_name,
-                f"Data type {type_code} not parsed correctly"
-            )
+            with self.subTest(type_code=type_code):
+                with open(self.test_file_path, 'r+b') as f:
+                    f.seek(45)
+                    f.write(bytes([type_code]))
+                loader = KretzFileLoader(str(self.test_file_path))
+                self.assertEqual(
+                    loader.metadata['data_type'],
+                    expected_name,
+                    f"Data type {type_code} not parsed correctly"
+                )
 
     def test_get_volume(self):
         """Test retrieving volume data."""
@@ -258,7 +299,7 @@ class TestKretzFileLoader(unittest.TestCase):
     def test_get_dimension(self):
         """Test getting volume dimensions."""
         dims = (15, 20, 25)
-        self._create_test_file(dims=dims)
+        self._create_test_file(dims=dims, write_volume_data=False)
         loader = KretzFileLoader(str(self.test_file_path))
 
         retrieved_dims = loader.get_dimension()
@@ -267,7 +308,7 @@ class TestKretzFileLoader(unittest.TestCase):
     def test_get_spacing(self):
         """Test getting voxel spacing."""
         spacing = (0.3, 0.4, 0.5)
-        self._create_test_file(spacing=spacing)
+        self._create_test_file(spacing=spacing, write_volume_data=False)
         loader = KretzFileLoader(str(self.test_file_path))
 
         retrieved_spacing = loader.get_spacing()
@@ -280,7 +321,8 @@ class TestKretzFileLoader(unittest.TestCase):
         self._create_test_file(
             patient_name="Jane Smith",
             study_date="2024-07-20",
-            study_time="14:30:00"
+            study_time="14:30:00",
+            write_volume_data=False
         )
         loader = KretzFileLoader(str(self.test_file_path))
 
@@ -293,7 +335,8 @@ class TestKretzFileLoader(unittest.TestCase):
         """Test retrieving system information."""
         self._create_test_file(
             system_name="Voluson E10",
-            probe_name="RSP6-16"
+            probe_name="RSP6-16",
+            write_volume_data=False
         )
         loader = KretzFileLoader(str(self.test_file_path))
 
@@ -344,10 +387,98 @@ class TestKretzFileLoader(unittest.TestCase):
         self.assertNotEqual(volume2[0, 0, 0], 255)
         self.assertNotEqual(loader.volume[0, 0, 0], 255)
 
+    def test_get_volume_without_copy(self):
+        """Test that get_volume(copy=False) returns the read-only original."""
+        self._create_test_file(data_type=4)
+        loader = KretzFileLoader(str(self.test_file_path))
+
+        volume = loader.get_volume(copy=False)
+
+        self.assertIs(volume, loader.volume)
+        self.assertIs(type(volume), np.ndarray)
+        self.assertIs(type(loader.get_volume()), np.ndarray)
+        self.assertFalse(volume.flags.writeable)
+        np.testing.assert_array_equal(volume, loader.get_volume())
+
+    def test_get_volume_without_copy_read_only(self):
+        """Test that compressed and truncated volumes are returned read-only."""
+        self._create_test_file(
+            dims=(2, 2, 2), compressed=True, write_volume_data=False,
+            no_cache=True
+        )
+        with open(self.test_file_path, 'ab') as f:
+            f.write(bytes([8, 3]))
+        # Preload, since the same path is rewritten below
+        compressed = KretzFileLoader(str(self.test_file_path), preload=True)
+
+        self._create_test_file(no_cache=True)
+        with open(self.test_file_path, 'r+b') as f:
+            f.truncate(256 + 500)
+        truncated = KretzFileLoader(str(self.test_file_path))
+
+        for name, loader in (('compressed', compressed), ('truncated', truncated)):
+            with self.subTest(name):
+                self.assertFalse(loader.get_volume(copy=False).flags.writeable)
+                self.assertTrue(loader.get_volume().flags.writeable)
+
+    def test_volume_native_byte_order(self):
+        """Test that little-endian voxels load into a native-order array."""
+        dims = (4, 5, 6)
+        self._create_test_file(dims=dims, data_type=4)
+        loader = KretzFileLoader(str(self.test_file_path))
+
+        volume = loader.get_volume(copy=False)
+        expected = np.arange(np.prod(dims), dtype='<i2').reshape(dims)
+
+        self.assertTrue(volume.dtype.isnative)
+        self.assertEqual(volume.dtype, np.int16)
+        np.testing.assert_array_equal(volume, expected)
+
+    def test_32bit_integer_volume(self):
+        """Test that 32-bit integer voxels are read at their stored width."""
+        dims = (3, 4, 5)
+        self._create_test_file(dims=dims, data_type=5)
+        loader = KretzFileLoader(str(self.test_file_path))
+
+        np.testing.assert_array_equal(
+            loader.get_volume(), np.arange(np.prod(dims), dtype=np.int32).reshape(dims)
+        )
+        self.assertNotIn('volume_data_missing', loader.metadata)
+
+    def test_truncated_volume_data(self):
+        """Test that a file shorter than its dimensions marks data missing."""
+        self._create_test_file(no_cache=True)
+        with open(self.test_file_path, 'r+b') as f:
+            f.truncate(256 + 500)
+        loader = KretzFileLoader(str(self.test_file_path))
+
+        self.assertTrue(loader.get_metadata()['volume_data_missing'])
+        self.assertIsNone(loader._volume)
+        self.assertFalse(loader.get_volume().any())
+
+    def test_volume_loaded_lazily(self):
+        """Test that volume data is only read when first accessed."""
+        self._create_test_file()
+        loader = KretzFileLoader(str(self.test_file_path))
+
+        self.assertEqual(loader.get_dimension(), (10, 10, 10))
+        self.assertIsNone(loader._volume)
+
+        volume = loader.get_volume()
+        self.assertEqual(volume.shape, (10, 10, 10))
+        self.assertIsNotNone(loader._volume)
+
+    def test_preload(self):
+        """Test that preload reads the volume data during construction."""
+        self._create_test_file()
+        loader = KretzFileLoader(str(self.test_file_path), preload=True)
+
+        self.assertIsNotNone(loader._volume)
+
     def test_repr(self):
         """Test string representation of loader."""
         dims = (10, 12, 14)
-        self._create_test_file(dims=dims)
+        self._create_test_file(dims=dims, write_volume_data=False)
         loader = KretzFileLoader(str(self.test_file_path))
 
         repr_str = repr(loader)
@@ -357,18 +488,25 @@ class TestKretzFileLoader(unittest.TestCase):
 
     def test_empty_patient_name(self):
         """Test handling of empty patient name."""
-        self._create_test_file(patient_name="")
+        self._create_test_file(patient_name="", write_volume_data=False)
         loader = KretzFileLoader(str(self.test_file_path))
 
         self.assertEqual(loader.get_patient_info()['patient_name'], "")
 
     def test_unicode_patient_name(self):
         """Test handling of unicode characters in patient name."""
-        self._create_test_file(patient_name="José García")
+        self._create_test_file(patient_name="José García", write_volume_data=False)
         loader = KretzFileLoader(str(self.test_file_path))
 
         self.assertEqual(loader.get_patient_info()['patient_name'], "José García")
 
+    def test_string_field_ends_at_null(self):
+        """Test that bytes after a string field's null terminator are ignored."""
+        self._create_test_file(probe_name="RAB6\x00stale", write_volume_data=False)
+        loader = KretzFileLoader(str(self.test_file_path))
+
+        self.assertEqual(loader.get_system_info()['probe_name'], "RAB6")
+
     def test_compressed_flag_parsing(self):
         """Test that compression flag is correctly parsed."""
         self._create_test_file(compressed=True, write_volume_data=False)
@@ -378,11 +516,63 @@ class TestKretzFileLoader(unittest.TestCase):
 
     def test_uncompressed_flag_parsing(self):
         """Test that uncompressed flag is correctly parsed."""
-        self._create_test_file(compressed=False)
+        self._create_test_file(compressed=False, write_volume_data=False)
         loader = KretzFileLoader(str(self.test_file_path))
 
         self.assertFalse(loader.metadata['compressed'])
 
+    def test_compressed_volume_decoding(self):
+        """Test that RLE compressed volume data is decoded."""
+        dims = (2, 3, 4)
+        self._create_test_file(
+            dims=dims, data_type=1, compressed=True, write_volume_data=False,
+            no_cache=True
+        )
+        runs = [(5, 7), (10, 300), (9, 65535)]
+        with open(self.test_file_path, 'ab') as f:
+            for count, value in runs:
+                f.write(struct.pack('<BH', count, value))
+
+        loader = KretzFileLoader(str(self.test_file_path))
+        expected = np.repeat(
+            np.array([v for _, v in runs], dtype=np.uint16), [c for c, _ in runs]
+        ).reshape(dims)
+
+        np.testing.assert_array_equal(loader.get_volume(), expected)
+        self.assertNotIn('volume_data_missing', loader.metadata)
+
+    def test_truncated_compressed_volume_data(self):
+        """Test that RLE data decoding to too few voxels marks data missing."""
+        dims = (2, 3, 4)
+        self._create_test_file(
+            dims=dims, data_type=1, compressed=True, write_volume_data=False,
+            no_cache=True
+        )
+        with open(self.test_file_path, 'ab') as f:
+            # 15 of 24 voxels, then half of a third record
+            f.write(struct.pack('<BHBH', 5, 7, 10, 300) + b'\x09\xff')
+        loader = KretzFileLoader(str(self.test_file_path))
+
+        self.assertTrue(loader.get_metadata()['volume_data_missing'])
+        self.assertIsNone(loader._volume)
+        self.assertEqual(loader.get_volume().shape, dims)
+        self.assertFalse(loader.get_volume().any())
+
+    def test_decompress_rle_stream_end(self):
+        """Test that RLE decoding stops at a zero count or partial record."""
+        data = bytes([3, 1, 2, 2, 0, 9, 4, 4])
+        decoded = KretzFileLoader._decompress_rle(data, np.uint8, 100)
+        np.testing.assert_array_equal(decoded, [1, 1, 1, 2, 2])
+
+        data = struct.pack('<BhBh', 2, -5, 3, 6) + b'\x04\x01'
+        decoded = KretzFileLoader._decompress_rle(data, np.int16, 100)
+        np.testing.assert_array_equal(decoded, [-5, -5, 6, 6, 6])
+
+        # Decoding stops after the run that reaches num_voxels
+        data = bytes([3, 1, 3, 2, 3, 3])
+        decoded = KretzFileLoader._decompress_rle(data, np.uint8, 4)
+        np.testing.assert_array_equal(decoded, [1, 1, 1, 2, 2, 2])
+
     def test_large_volume(self):
         """Test loading a larger volume."""
         dims = (64, 64, 64)
@@ -397,62 +587,56 @@ class TestKretzFileLoader(unittest.TestCase):
 class TestKretzFileLoaderIntegration(unittest.TestCase):
     """Integration tests for KretzFileLoader."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the directory shared by the tests."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared directory."""
+        cls.temp_dir.cleanup()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_file_path = Path(self.temp_dir.name) / "integration_test.vol"
+        self.test_file_path = (
+            Path(self.temp_dir.name) / f"{self._testMethodName}_integration_test.vol"
+        )
 
     def tearDown(self):
         """Clean up test fixtures."""
-        self.temp_dir.cleanup()
+        self.test_file_path.unlink(missing_ok=True)
 
     def _create_test_file(self, dims=(10, 10, 10)):
         """Create a test kretzfile."""
-        with open(self.test_file_path, 'wb') as f:
-            # Write magic string
-            f.write(b"KRETZFILE")
-            f.write(b"1.0 ")
-
-            # Pad to offset 16
-            f.write(b'\x00' * (16 - f.tell()))
+        # Zero-filled 256-byte header
+        header = bytearray(256)
 
-            # Write frame count
-            f.write(struct.pack('<I', 1))
+        # Magic string and version
+        _HDR_MAGIC.pack_into(header, 0, b"KRETZFILE", b"1.0", b" ")
 
-            # Write dimensions
-            f.write(struct.pack('<III', dims[0], dims[1], dims[2]))
+        # Frame count, dimensions and spacing
+        _HDR_FRAME_COUNT.pack_into(header, 16, 1)
+        _HDR_DIMS.pack_into(header, 20, dims[0], dims[1], dims[2])
+        _HDR_SPACING.pack_into(header, 32, 1.0, 1.0, 1.0)
 
-            # Write spacing
-            f.write(struct.pack('<fff', 1.0, 1.0, 1.0))
+        # Coordinate system (cartesian), data type (uint8), compression flag
+        _HDR_FLAGS.pack_into(header, 44, 0, 0, 0)
 
-            # Write coordinate system (cartesian)
-            f.write(struct.pack('<B', 0))
-
-            # Write data type (uint8)
-            f.write(struct.pack('<B', 0))
-
-            # Write compression flag
-            f.write(struct.pack('<B', 0))
-
-            # Pad to offset 48
-            f.write(b'\x00' * (48 - f.tell()))
-
-            # Write dummy metadata (patient name, dates, system info)
-            f.write(b"Test Patient" + b'\x00' * 52)  # 64 bytes total
-            f.write(b"2024-01-01" + b'\x00' * 6)    # 16 bytes total
-            f.write(b"12:00:00" + b'\x00' * 8)      # 16 bytes total
-            f.write(b"3D" + b'\x00' * 30)           # 32 bytes total
-            f.write(b"GE Voluson" + b'\x00' * 22)   # 32 bytes total
-            f.write(b"Probe 1" + b'\x00' * 25)      # 32 bytes total
-            f.write(struct.pack('<fff', 0.0, 0.0, 0.0))  # origin
+        # Dummy metadata (patient name, dates, system info); origin stays zero
+        _HDR_STRINGS.pack_into(
+            header, 48,
+            b"Test Patient", b"2024-01-01", b"12:00:00",
+            b"3D", b"GE Voluson", b"Probe 1"
+        )
 
-            # Pad to offset 256
-            f.write(b'\x00' * (256 - f.tell()))
+        with open(self.test_file_path, 'wb', buffering=0) as f:
+            f.write(header)
 
             # Write volume data
             num_voxels = dims[0] * dims[1] * dims[2]
-            volume_data = np.ones(num_voxels, dtype=np.uint8) * 128
-            f.write(volume_data.tobytes())
+            volume_data = np.full(num_voxels, 128, dtype=np.uint8)
+            volume_data.tofile(f)
 
     def test_end_to_end_workflow(self):
         """Test a complete workflow of loading and accessing data."""